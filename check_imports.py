@@ -3,57 +3,74 @@ Diagnostic script to check all imports
 """
 import sys
 import os
+import importlib
+import importlib.util
+import json
 
 # Add current directory to Python path
 sys.path.insert(0, os.getcwd())
 
+# Lines are buffered and written once at the end. Each check also records a
+# (name, ok, error) result, written as JSON instead of the text with --json.
+output = []
+results = []
+
+# (section, [(module path, class name or None), ...])
+MODULE_CHECKS = [
+    ("Core Modules", [
+        ("src.core.config_manager", "ConfigManager"),
+        ("src.core.browser_manager", "BrowserManager"),
+        ("src.core.cache_manager", "CacheManager"),
+        ("src.core.ai_element_finder", "AIElementFinder"),
+    ]),
+    ("Parser Modules", [
+        ("src.parser.feature_parser", "FeatureParser"),
+        ("src.parser.step_mapper", "StepMapper"),
+    ]),
+    ("Executor Modules", [
+        ("src.executor.test_executor", "TestExecutor"),
+        ("src.executor.step_executor", "StepExecutor"),
+        ("src.executor.action_handler", "ActionHandler"),
+    ]),
+    ("Other Modules", [
+        ("src.reports.html_reporter", "HTMLReporter"),
+        ("src.utils.logger", "setup_logger"),
+    ]),
+    # External dependencies are only located, never imported
+    ("External Dependencies", [
+        ("playwright", None),
+        ("click", None),
+        ("yaml", None),
+        ("pytest", None),
+    ]),
+]
+
 def check_import(module_path, class_name=None):
-    """Check if a module can be imported"""
+    """Check if a module can be found, importing it only when a class is requested"""
     try:
+        if importlib.util.find_spec(module_path) is None:
+            raise ModuleNotFoundError(f"No module named '{module_path}'")
         if class_name:
-            exec(f"from {module_path} import {class_name}")
-            print(f"✓ Successfully imported {class_name} from {module_path}")
+            module = importlib.import_module(module_path)
+            getattr(module, class_name)
+            output.append(f"✓ Successfully imported {class_name} from {module_path}")
         else:
-            exec(f"import {module_path}")
-            print(f"✓ Successfully imported {module_path}")
+            output.append(f"✓ Found {module_path}")
+        results.append((module_path, True, None))
         return True
     except Exception as e:
-        print(f"✗ Failed to import {module_path}: {e}")
+        output.append(f"✗ Failed to import {module_path}: {e}")
+        results.append((module_path, False, str(e)))
         return False
 
-print("Checking AITestRunner imports...\n")
-
-# Check core modules
-print("=== Core Modules ===")
-check_import("src.core.config_manager", "ConfigManager")
-check_import("src.core.browser_manager", "BrowserManager")
-check_import("src.core.cache_manager", "CacheManager")
-check_import("src.core.ai_element_finder", "AIElementFinder")
-
-# Check parser modules
-print("\n=== Parser Modules ===")
-check_import("src.parser.feature_parser", "FeatureParser")
-check_import("src.parser.step_mapper", "StepMapper")
+output.append("Checking AITestRunner imports...")
 
-# Check executor modules
-print("\n=== Executor Modules ===")
-check_import("src.executor.test_executor", "TestExecutor")
-check_import("src.executor.step_executor", "StepExecutor")
-check_import("src.executor.action_handler", "ActionHandler")
+for section, checks in MODULE_CHECKS:
+    output.append(f"\n=== {section} ===")
+    for module_path, class_name in checks:
+        check_import(module_path, class_name)
 
-# Check other modules
-print("\n=== Other Modules ===")
-check_import("src.reports.html_reporter", "HTMLReporter")
-check_import("src.utils.logger", "setup_logger")
-
-# Check external dependencies
-print("\n=== External Dependencies ===")
-check_import("playwright")
-check_import("click")
-check_import("yaml")
-check_import("pytest")
-
-print("\n=== Checking file existence ===")
+output.append("\n=== Checking file existence ===")
 required_files = [
     "run.py",
     "src/__init__.py",
@@ -64,8 +81,27 @@ required_files = [
     "src/utils/__init__.py",
 ]
 
+# List each parent directory once instead of stat-ing every file
+listings = {}
 for file_path in required_files:
-    if os.path.exists(file_path):
-        print(f"✓ {file_path} exists")
+    directory = os.path.dirname(file_path) or '.'
+    if directory not in listings:
+        try:
+            with os.scandir(directory) as entries:
+                listings[directory] = {entry.name for entry in entries}
+        except OSError:
+            listings[directory] = set()
+
+for file_path in required_files:
+    if os.path.basename(file_path) in listings[os.path.dirname(file_path) or '.']:
+        output.append(f"✓ {file_path} exists")
+        results.append((file_path, True, None))
     else:
-        print(f"✗ {file_path} missing")
\ No newline at end of file
+        output.append(f"✗ {file_path} missing")
+        results.append((file_path, False, "missing"))
+
+if '--json' in sys.argv[1:]:
+    sys.stdout.write(json.dumps([{'name': name, 'ok': ok, 'error': error}
+                                 for name, ok, error in results], indent=2) + "\n")
+else:
+    sys.stdout.write("\n".join(output) + "\n")
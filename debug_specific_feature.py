@@ -45,10 +45,9 @@ print(f"Parsed params: {params}")
 # Check all table patterns
 print("\n" + "="*50)
 print("Checking all table verification patterns:")
-import re
-patterns = parser.action_patterns['verify_table']['patterns']
+patterns = parser.action_patterns['verify_table']['compiled']
 for i, pattern in enumerate(patterns):
-    if re.match(pattern, step_text, re.IGNORECASE):
-        print(f"Pattern {i} MATCHES: {pattern}")
+    if pattern.match(step_text):
+        print(f"Pattern {i} MATCHES: {pattern.pattern}")
     else:
-        print(f"Pattern {i} no match: {pattern}")
\ No newline at end of file
+        print(f"Pattern {i} no match: {pattern.pattern}")
\ No newline at end of file
@@ -8,30 +8,31 @@ import click
 import sys
 import os
 from pathlib import Path
-from src.core.config_manager import ConfigManager
-from src.core.browser_manager import BrowserManager
-from src.parser.feature_parser import FeatureParser
-from src.executor.test_executor import TestExecutor
-from src.reports.html_reporter import HTMLReporter
-from src.utils.logger import setup_logger
+from types import MappingProxyType
 
-# Initialize logger
-logger = setup_logger(__name__)
 
+def validate_env(ctx, param, value):
+    """Reject malformed environment names before any heavy imports happen"""
+    if not value or '/' in value or '\\' in value:
+        raise click.BadParameter(f"invalid environment name: {value!r}")
+    return value
 
-@click.command()
-@click.option('--env', '-e', default='dev', help='Environment to run tests (dev/staging/prod)')
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.option('--env', '-e', default='dev', callback=validate_env,
+              help='Environment to run tests (dev/staging/prod)')
 @click.option('--tags', '-t', multiple=True, help='Tags to filter scenarios')
-@click.option('--features', '-f', default='features', help='Path to features directory')
-@click.option('--headless', is_flag=True, help='Run in headless mode')
+@click.option('--features', '-f', default='features',
+              type=click.Path(exists=True, file_okay=False), help='Path to features directory')
+@click.option('--headless/--headed', default=False, help='Run in headless mode')
 @click.option('--parallel', '-p', default=1, type=int, help='Number of parallel executions')
 @click.option('--report', '-r', default='html', help='Report format (html/json/both)')
 @click.option('--config', '-c', default='config/config.yaml', help='Path to config file')
 @click.option('--browser', '-b', default='chromium', help='Browser to use (chromium/firefox/webkit)')
 @click.option('--slow-mo', default=0, type=int, help='Slow down execution by milliseconds')
-@click.option('--screenshot', is_flag=True, help='Take screenshots on failure')
-@click.option('--video', is_flag=True, help='Record video of execution')
-@click.option('--cache', default=True, is_flag=True, help='Use element cache')
+@click.option('--screenshot/--no-screenshot', default=False, help='Take screenshots on failure')
+@click.option('--video/--no-video', default=False, help='Record video of execution')
+@click.option('--cache/--no-cache', default=True, help='Use element cache')
 @click.option('--ai-model', default='yolo-world', help='AI model to use (yolo-world/mobilenet/none)')
 def main(env, tags, features, headless, parallel, report, config, browser,
          slow_mo, screenshot, video, cache, ai_model):
@@ -48,67 +49,86 @@ def main(env, tags, features, headless, parallel, report, config, browser,
         # Run with video recording
         python run.py --env staging --video --screenshot
     """
+    # Heavy modules (Playwright, OpenCV, ultralytics) are imported only once the
+    # CLI has been validated, so --help and bad flags return immediately.
+    from src.utils.logger import setup_logger
+    from src.core.config_manager import ConfigManager
+    from src.parser.feature_parser import FeatureParser
+
+    logger = setup_logger(__name__)
 
     try:
-        logger.info(f"Starting AITestRunner v1.0.0")
-        logger.info(f"Environment: {env}")
-        logger.info(f"Browser: {browser}")
-        logger.info(f"AI Model: {ai_model}")
+        logger.info("Starting AITestRunner v1.0.0")
+        logger.info("Environment: %s", env)
+        logger.info("Browser: %s", browser)
+        logger.info("AI Model: %s", ai_model)
 
         # Load configuration
         config_manager = ConfigManager(config, env)
         config_data = config_manager.load_config()
 
         # Parse feature files
-        feature_parser = FeatureParser(features)
-        test_suites = feature_parser.parse_features(tags)
+        features_path = Path(features).resolve()
+        feature_parser = FeatureParser(features_path)
+        tag_filter = frozenset(tags) if tags else None
+        test_suites = feature_parser.parse_features(tag_filter)
 
         if not test_suites:
             logger.warning("No test scenarios found matching the criteria")
             return
 
-        logger.info(f"Found {len(test_suites)} test suites to execute")
+        logger.info("Found %d test suites to execute", len(test_suites))
+
+        # Only pay for Playwright once there is something to run
+        from src.core.browser_manager import BrowserManager
+        from src.executor.test_executor import TestExecutor
 
         # Initialize browser manager
-        browser_options = {
+        # Read-only view so the same options can be shared across worker threads
+        browser_options = MappingProxyType({
             'headless': headless,
             'browser': browser,
             'slow_mo': slow_mo,
             'screenshot': screenshot,
             'video': video
-        }
+        })
 
         browser_manager = BrowserManager(browser_options)
 
         # Initialize test executor
-        executor = TestExecutor(
+        with TestExecutor(
             config_data=config_data,
             browser_manager=browser_manager,
             use_cache=cache,
             ai_model=ai_model,
             parallel=parallel
-        )
-
-        # Execute tests
-        results = executor.execute_suites(test_suites)
+        ) as executor:
+            # Execute tests
+            results = executor.execute_suites(test_suites)
 
         # Generate reports
-        reporter = HTMLReporter() if report in ['html', 'both'] else None
-        if reporter:
-            report_path = reporter.generate_report(results)
-            logger.info(f"Report generated: {report_path}")
+        if report in ('html', 'both'):
+            try:
+                from src.reports.html_reporter import HTMLReporter
+            except ImportError as e:
+                logger.error("HTML report unavailable (%s); "
+                             "install with: pip install aitestrunner[report-html]", e)
+            else:
+                reporter = HTMLReporter()
+                report_path = reporter.generate_report(results)
+                logger.info("Report generated: %s", report_path)
 
         # Exit with appropriate code
-        failed_count = sum(1 for r in results if r['status'] == 'failed')
-        if failed_count > 0:
-            logger.error(f"Tests completed with {failed_count} failures")
+        failed_count = executor.failed_count
+        if failed_count:
+            logger.error("Tests completed with %d failures", failed_count)
             sys.exit(1)
         else:
             logger.info("All tests passed successfully!")
             sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Execution failed: {str(e)}")
+        logger.error("Execution failed: %s", e)
         sys.exit(1)
 
 
@@ -31,16 +31,24 @@ setup(
         "pyyaml>=6.0.1",
         "click>=8.1.7",
         "pytest>=7.4.3",
-        "Pillow>=10.1.0",
-        "opencv-python-headless>=4.8.1.78",
-        "numpy>=1.24.4",
         "requests>=2.31.0",
-        "jinja2>=3.1.2",
         "colorama>=0.4.6",
         "python-dotenv>=1.0.0",
     ],
     extras_require={
-        "ai": ["ultralytics>=8.0.200"],
+        "imaging": [
+            "Pillow>=10.1.0",
+            "opencv-python-headless>=4.8.1.78",
+            "numpy>=1.24.4",
+        ],
+        "report-html": ["jinja2>=3.1.2"],
+        "speedups": ["orjson>=3.9.10", "pyahocorasick>=2.0.0", "aiodns>=3.1.1"],
+        "ai": [
+            "ultralytics>=8.0.200",
+            "Pillow>=10.1.0",
+            "opencv-python-headless>=4.8.1.78",
+            "numpy>=1.24.4",
+        ],
         "nlp": ["spacy>=3.7.2"],
         "dev": [
             "pytest-cov>=4.1.0",
@@ -50,6 +58,13 @@ setup(
         ],
         "all": [
             "ultralytics>=8.0.200",
+            "Pillow>=10.1.0",
+            "opencv-python-headless>=4.8.1.78",
+            "numpy>=1.24.4",
+            "jinja2>=3.1.2",
+            "orjson>=3.9.10",
+            "pyahocorasick>=2.0.0",
+            "aiodns>=3.1.1",
             "spacy>=3.7.2",
             "pytest-cov>=4.1.0",
             "black>=23.10.0",
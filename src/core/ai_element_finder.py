@@ -3,15 +3,280 @@ AI-based element finder using lightweight models
 Supports YOLO-World for zero-shot object detection
 """
 
+import hashlib
 import json
-import numpy as np
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 from pathlib import Path
-import cv2
 import base64
-from PIL import Image
-import io
 import re
+from playwright.sync_api import Error as PlaywrightError
+from src.utils.imports import cached_import
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, substring scans are the fallback
+    ahocorasick = None
+
+# Trailing "field"/"button"/... words stripped from descriptions before text search
+DESCRIPTION_SUFFIX_PATTERN = re.compile(r'\s*(field|button|input|textbox)$', re.IGNORECASE)
+
+# Classes YOLO-World is prompted with; their hash is part of the ONNX export's file name
+YOLO_WORLD_CLASSES = ("button", "input", "link", "text", "image",
+                      "dropdown", "checkbox", "radio", "tab")
+
+# Element type keywords, checked in order - the first type with a match wins
+ELEMENT_TYPE_KEYWORDS = [
+    ('button', r'button|btn|click|submit|save|cancel|close|add|delete|remove'),
+    ('input', r'input|field|textbox|enter|type|fill|search'),
+    ('link', r'link|href|navigate|go to'),
+    ('dropdown', r'dropdown|select|choose|option|listbox|combobox'),
+    ('checkbox', r'checkbox|check|tick|mark'),
+    ('radio', r'radio button|radio|option button|select one'),
+    ('text', r'text|label|heading|title|contains'),
+]
+
+# Keyword -> element type it implies when matching AI detections to a description
+DESCRIPTION_KEYWORD_TYPES = (
+    ('button', 'button'), ('click', 'button'), ('submit', 'button'), ('press', 'button'),
+    ('input', 'input'), ('field', 'input'), ('enter', 'input'), ('type', 'input'),
+    ('link', 'link'), ('navigate', 'link'), ('href', 'link'),
+    ('dropdown', 'dropdown'), ('select', 'dropdown'), ('choose', 'dropdown'),
+    ('checkbox', 'checkbox'), ('check', 'checkbox'), ('tick', 'checkbox'),
+    ('radio', 'radio'), ('option', 'radio'),
+    ('text', 'text'), ('label', 'text'), ('contains', 'text'),
+)
+
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over DESCRIPTION_KEYWORD_TYPES, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, elem_type in DESCRIPTION_KEYWORD_TYPES:
+        automaton.add_word(keyword, elem_type)
+    automaton.make_automaton()
+    return automaton
+
+
+# One pass over the description finds every keyword at once
+DESCRIPTION_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# All types fused into one anchored regex: each alternative is a lookahead over the
+# whole description, so alternation order preserves type precedence (not keyword position)
+# and match.lastgroup names the element type.
+ELEMENT_TYPE_CLASSIFIER = re.compile(
+    '^(?:' + '|'.join(f'(?=.*?(?P<{elem_type}>{keywords}))'
+                      for elem_type, keywords in ELEMENT_TYPE_KEYWORDS) + ')',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Candidate selector templates per (element family, has search text), most specific
+# first. Placeholders: {text}, and the lowercased {lower}/{nospace}/{under}/{dash}.
+SELECTOR_TEMPLATES = {
+    ('button', True): (
+        # Try submit/button inputs first (most specific)
+        'input[type="submit"][value*="{text}" i]',
+        'input[type="button"][value*="{text}" i]',
+        # Then actual button elements
+        'button:has-text("{text}")',
+        # Role-based buttons
+        '[role="button"]:has-text("{text}")',
+        # Link styled as button
+        'a.button:has-text("{text}")',
+        'a.btn:has-text("{text}")',
+        # Generic class-based buttons
+        '*[class*="btn"]:has-text("{text}")',
+        '*[class*="button"]:has-text("{text}")',
+    ),
+    ('button', False): ('button', '[role="button"]', 'input[type="submit"]', 'input[type="button"]'),
+    ('dropdown', True): (
+        # Native HTML select elements (most specific)
+        'select[name*="{nospace}" i]',
+        'select[id*="{nospace}" i]',
+        'select[aria-label*="{text}" i]',
+        # Ant Design selects
+        '.ant-select:has-text("{text}")',
+        '.ant-select[aria-label*="{text}" i]',
+        'input[role="combobox"][id*="{dash}" i]',
+        # Material UI selects
+        '.MuiSelect-root:has-text("{text}")',
+        '.MuiInputBase-root:has-text("{text}")',
+        'div[role="button"][aria-haspopup="listbox"]:has-text("{text}")',
+        # Bootstrap selects
+        '.custom-select:has-text("{text}")',
+        '.form-select:has-text("{text}")',
+        '.dropdown-toggle:has-text("{text}")',
+        # React Select
+        '.react-select__control:has-text("{text}")',
+        '.Select__control:has-text("{text}")',
+        # Generic ARIA patterns
+        '[role="combobox"][aria-label*="{text}" i]',
+        '[role="listbox"][aria-label*="{text}" i]',
+        '[role="button"][aria-haspopup="listbox"]:has-text("{text}")',
+        # Generic class patterns
+        'div[class*="select"][aria-label*="{text}" i]',
+        'div[class*="dropdown"][aria-label*="{text}" i]',
+        '*[class*="select"]:has-text("{text}")',
+        '*[class*="dropdown"]:has-text("{text}")',
+        # Label associations
+        'label:has-text("{text}") + select',
+        'label:has-text("{text}") + .ant-select',
+        'label:has-text("{text}") + .MuiSelect-root',
+        'label:has-text("{text}") + div[class*="select"]',
+        'label:has-text("{text}") + div[class*="dropdown"]',
+        'label:has-text("{text}") + [role="combobox"]',
+        # Fallback generic selectors
+        '.ant-select',
+        '.MuiSelect-root',
+        '.custom-select',
+        '.form-select',
+        '.react-select__control',
+        'select',
+        'input[role="combobox"]',
+        '[role="combobox"]',
+        '[role="listbox"]',
+        '[aria-haspopup="listbox"]',
+    ),
+    ('dropdown', False): (
+        'select', '.ant-select', '.MuiSelect-root', '.custom-select', '.form-select',
+        '[role="combobox"]', '[role="listbox"]',
+    ),
+    ('input', True): (
+        # By placeholder
+        'input[placeholder*="{text}" i]',
+        # By aria-label
+        'input[aria-label*="{text}" i]',
+        # By id
+        'input[id*="{nospace}" i]',
+        'input[id*="{under}" i]',
+        'input[id*="{dash}" i]',
+        # By name
+        'input[name*="{nospace}" i]',
+        'input[name*="{under}" i]',
+        'input[name*="{dash}" i]',
+        # By label
+        'label:has-text("{text}") + input',
+        'label:has-text("{text}") input',
+        # Generic input near text
+        'input:near(:text("{text}"))',
+        # Try with different variations
+        'input[placeholder*="{lower}" i]',
+        'input[aria-label*="{lower}" i]',
+        # Rich text editor patterns
+        'div.ant-form-item:has(label:has-text("{text}")) [contenteditable="true"]',
+        'div.ant-form-item:has(label:has-text("{text}")) .ql-editor',
+        'div:has(label:has-text("{text}")) [contenteditable="true"]',
+        'div:has(label:has-text("{text}")) .ql-editor',
+        'label:has-text("{text}") ~ div [contenteditable="true"]',
+        'label:has-text("{text}") ~ div .ql-editor',
+        '[aria-label*="{text}" i][contenteditable="true"]',
+        '.editor-container:near(:text("{text}"))',
+        '[role="textbox"]:near(:text("{text}"))',
+        # For cases where the label is separate from the editor
+        'div:below(:text("{text}"), 100) [contenteditable="true"]',
+        'div:below(:text("{text}"), 100) .ql-editor',
+    ),
+    ('input', False): ('input[type="text"]', 'input:not([type="hidden"])'),
+    ('link', True): ('a:has-text("{text}")', 'a[href*="{nospace}" i]'),
+    ('link', False): ('a',),
+}
+
+# Extra input selectors for common field names; the first matching hint wins
+INPUT_HINT_SELECTORS = (
+    (('username', 'user'), (
+        'input[type="text"][name*="user" i]',
+        'input[type="text"][id*="user" i]',
+        'input[type="email"]',
+        'input[autocomplete="username"]',
+    )),
+    (('password', 'pass'), (
+        'input[type="password"]',
+        'input[name*="pass" i]',
+        'input[id*="pass" i]',
+        'input[autocomplete="current-password"]',
+    )),
+    (('email',), (
+        'input[type="email"]',
+        'input[name*="email" i]',
+        'input[id*="email" i]',
+    )),
+    # Generic search selectors
+    (('search',), (
+        'input[type="search"]',
+        'input#search',
+        '#search',
+        'input[name*="search" i]',
+        'input[id*="search" i]',
+        'input[placeholder*="search" i]',
+        'input[aria-label*="search" i]',
+        'input[role="searchbox"]',
+        '.search-input',
+        '.search-field',
+        'input.search',
+    )),
+)
+
+# Selectors using Playwright-only syntax that Element.matches() can't run
+PLAYWRIGHT_SELECTOR_PATTERN = re.compile(
+    r':(?:has-text|text|text-is|has|near|below|above|left-of|right-of)\(|:visible\b|>>|^text='
+)
+
+# Given the union's matches, returns the first visible element across the selectors,
+# in selector order, with its index among that selector's own matches
+FIRST_VISIBLE_MATCH_JS = """
+(elements, selectors) => {
+    for (const selector of selectors) {
+        let index = 0;
+        for (const element of elements) {
+            if (!element.matches(selector)) {
+                continue;
+            }
+            const rect = element.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 &&
+                getComputedStyle(element).visibility !== 'hidden') {
+                return {
+                    selector: selector,
+                    index: index,
+                    bounds: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+                };
+            }
+            index++;
+        }
+    }
+    return null;
+}
+"""
+
+# Index and bounds of the first visible element of a locator, stopping at the first hit
+FIRST_VISIBLE_ELEMENT_JS = """
+(elements) => {
+    for (let i = 0; i < elements.length; i++) {
+        const rect = elements[i].getBoundingClientRect();
+        if (rect.width > 0 && rect.height > 0 &&
+            getComputedStyle(elements[i]).visibility !== 'hidden') {
+            return {index: i, bounds: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}};
+        }
+    }
+    return null;
+}
+"""
+
+# Per-element tag, role, visibility and bounds for a whole locator in one round-trip
+ELEMENT_INFO_JS = """
+(elements) => elements.map((el) => {
+    const rect = el.getBoundingClientRect();
+    const style = getComputedStyle(el);
+    return {
+        tag: el.tagName.toLowerCase(),
+        role: el.getAttribute('role'),
+        rendered: el.getClientRects().length > 0,
+        visible: rect.width > 0 && rect.height > 0 &&
+                 style.visibility !== 'hidden' && style.display !== 'none',
+        bounds: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+    };
+})
+"""
 
 class AIElementFinder:
     """
@@ -21,7 +286,6 @@ class AIElementFinder:
     def __init__(self, model_type='yolo-world', cache_manager=None):
         self.model_type = model_type
         self.cache_manager = cache_manager
-        self.element_cache = {}
         self.model = None
         self._initialize_model()
 
@@ -31,18 +295,43 @@ class AIElementFinder:
             # Use YOLO-World for zero-shot detection
             # This is a lightweight model that doesn't require GPU
             try:
-                from ultralytics import YOLO
-                # Download nano version for efficiency
-                self.model = YOLO('yolov8n-world.pt')
-                self.model.set_classes(["button", "input", "link", "text", "image",
-                                      "dropdown", "checkbox", "radio", "tab"])
-            except:
+                YOLO = cached_import('ultralytics', 'YOLO')
+                self.model = self._load_exported_model(YOLO)
+            except Exception:
                 print("YOLO-World not available, falling back to pattern matching")
                 self.model_type = 'pattern'
         elif self.model_type == 'pattern':
             # Use pattern matching as fallback
             self.model = None
 
+    def _load_exported_model(self, yolo_cls, weights: str = 'yolov8n-world.pt'):
+        """
+        Load the ONNX export of the YOLO-World model (FP16 on CUDA, FP32 on CPU)
+
+        An existing export is loaded directly; the PyTorch weights are only
+        loaded (and the classes set) when the export has to be created. The
+        file name carries a hash of the class list, so changing the classes
+        triggers a fresh export. Any export failure (e.g. onnx/onnxruntime
+        missing) keeps the PyTorch model.
+        """
+        half = cached_import('torch', 'cuda').is_available()
+        classes_hash = hashlib.blake2b('\n'.join(YOLO_WORLD_CLASSES).encode('utf-8'),
+                                       digest_size=4).hexdigest()
+        onnx_path = Path(weights).with_suffix(f".{classes_hash}{'.fp16' if half else ''}.onnx")
+        if onnx_path.exists():
+            return yolo_cls(str(onnx_path), task='detect')
+
+        # Download nano version for efficiency
+        model = yolo_cls(weights)
+        model.set_classes(list(YOLO_WORLD_CLASSES))
+        try:
+            exported = Path(model.export(format='onnx', half=half, imgsz=640))
+            exported.replace(onnx_path)
+            return yolo_cls(str(onnx_path), task='detect')
+        except Exception as e:
+            print(f"ONNX export unavailable ({e}), using PyTorch weights")
+            return model
+
     def find_element(self, page, description: str, screenshot=None) -> Optional[Dict]:
         """
         Find element using AI or pattern matching
@@ -50,21 +339,23 @@ class AIElementFinder:
         Args:
             page: Playwright page object
             description: Natural language description of element
-            screenshot: Optional screenshot for AI processing
+            screenshot: Optional screenshot for AI processing, or a callable
+                taking one; it is only called when AI detection runs
 
         Returns:
             Dictionary with element info or None
         """
         # Check cache first
-        cache_key = f"{page.url}:{description}"
-        if self.cache_manager and cache_key in self.element_cache:
-            cached = self.element_cache[cache_key]
+        cache_key = self._cache_key(page.url, description)
+        cached = self.cache_manager.get(cache_key) if self.cache_manager else None
+        # Coordinate-only (AI) hits have no selector to re-verify
+        if cached and cached.get('selector'):
             # Verify element still exists
             try:
                 element = page.locator(cached['selector'])
                 if element.count() > 0:
                     return cached
-            except:
+            except PlaywrightError:
                 pass
 
         # Try pattern matching in main frame first
@@ -74,24 +365,20 @@ class AIElementFinder:
             return element_info
 
         # Try pattern matching in iframes
-        try:
-            iframes = page.locator('iframe').all()
-            for iframe_element in iframes:
-                try:
-                    frame = iframe_element.content_frame()
-                    if frame:
-                        element_info = self._pattern_match(frame, description)
-                        if element_info:
-                            element_info['in_iframe'] = True
-                            self._cache_element(cache_key, element_info)
-                            return element_info
-                except:
-                    continue
-        except:
-            pass
+        for frame in self._get_iframes(page):
+            try:
+                element_info = self._pattern_match(frame, description)
+                if element_info:
+                    element_info['in_iframe'] = True
+                    self._cache_element(cache_key, element_info)
+                    return element_info
+            except PlaywrightError:
+                continue
 
         # Try AI detection if available
         if self.model and screenshot:
+            if callable(screenshot):
+                screenshot = screenshot()
             element_info = self._ai_detect(screenshot, description)
             if element_info:
                 self._cache_element(cache_key, element_info)
@@ -99,283 +386,95 @@ class AIElementFinder:
 
         return None
 
+    @staticmethod
+    def _get_iframes(page) -> List:
+        """Frames of the page's iframes; Playwright tracks the frame tree client-side"""
+        return list(getattr(page, 'main_frame', page).child_frames)
+
     def _ai_detect(self, screenshot, description: str) -> Optional[Dict]:
         """Use AI model to detect elements"""
         try:
-            # Convert screenshot to numpy array
-            if isinstance(screenshot, str):
-                # Base64 encoded
-                img_data = base64.b64decode(screenshot)
-                img = Image.open(io.BytesIO(img_data))
-            else:
-                img = screenshot
-
-            # Run inference
-            results = self.model(img, conf=0.5)
-
-            # Process results
+            results = self.model(self._decode_screenshot(screenshot), conf=0.5)
             for r in results:
-                boxes = r.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get class name
-                        cls_id = int(box.cls)
-                        cls_name = self.model.names[cls_id]
-
-                        # Match with description
-                        if self._matches_description(cls_name, description):
-                            x1, y1, x2, y2 = box.xyxy[0].tolist()
-                            center_x = (x1 + x2) / 2
-                            center_y = (y1 + y2) / 2
-
-                            return {
-                                'type': cls_name,
-                                'position': {'x': center_x, 'y': center_y},
-                                'bounds': {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2},
-                                'confidence': float(box.conf),
-                                'selector': None  # Will use coordinates
-                            }
+                element_info = self._match_detections(r, description)
+                if element_info:
+                    return element_info
         except Exception as e:
             print(f"AI detection error: {e}")
 
         return None
 
+    def _decode_screenshot(self, screenshot):
+        """Turn raw or base64 screenshot bytes into a BGR ndarray; other inputs pass through"""
+        if isinstance(screenshot, str):
+            screenshot = base64.b64decode(screenshot)
+        if isinstance(screenshot, (bytes, bytearray)):
+            # Decode straight into a BGR ndarray, which YOLO accepts as-is
+            # (imaging libs are an optional extra)
+            np_frombuffer = cached_import('numpy', 'frombuffer')
+            imdecode = cached_import('cv2', 'imdecode')
+            img_data = np_frombuffer(screenshot, dtype='uint8')
+            return imdecode(img_data, cached_import('cv2', 'IMREAD_COLOR'))
+        return screenshot
+
+    def _match_detections(self, result, description: str) -> Optional[Dict]:
+        """Return the first detection in one model result matching the description"""
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return None
+
+        # Resolve matching class ids once per description rather than once per box
+        wanted = {cls_id for cls_id, cls_name in self.model.names.items()
+                  if self._matches_description(cls_name, description)}
+        if not wanted:
+            return None
+
+        # Pull every box to host memory in one transfer, then scan plain ints
+        boxes = boxes.cpu().numpy()
+        for i, cls_id in enumerate(boxes.cls.astype(int).tolist()):
+            if cls_id in wanted:
+                x1, y1, x2, y2 = boxes.xyxy[i].tolist()
+                center_x = (x1 + x2) / 2
+                center_y = (y1 + y2) / 2
+
+                return {
+                    'type': self.model.names[cls_id],
+                    'position': {'x': center_x, 'y': center_y},
+                    'bounds': {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2},
+                    'confidence': float(boxes.conf[i]),
+                    'selector': None  # Will use coordinates
+                }
+        return None
+
     def _pattern_match(self, page, description: str) -> Optional[Dict]:
         """
         Smart pattern matching based on description
         Uses multiple strategies to find elements
         """
-        description_lower = description.lower()
-
-        # Clean up the description - remove extra quotes and field/button suffixes
-        description_clean = description.strip('"\'')
-        description_clean = re.sub(r'\s*(field|button|input|textbox)$', '', description_clean, flags=re.IGNORECASE)
-
-        # Extract key information
-        patterns = {
-            'button': r'(button|btn|click|submit|save|cancel|close|add|delete|remove)',
-            'input': r'(input|field|textbox|enter|type|fill|search)',
-            'link': r'(link|href|navigate|go to)',
-            'dropdown': r'(dropdown|select|choose|option|listbox|combobox)',
-            'checkbox': r'(checkbox|check|tick|mark)',
-            'radio': r'(radio button|radio|option button|select one)',
-            'text': r'(text|label|heading|title|contains)'
-        }
-
-        element_type = None
-        for elem_type, pattern in patterns.items():
-            if re.search(pattern, description_lower):
-                element_type = elem_type
-                break
-
-        # Extract text content - use the cleaned description as the text to search for
-        text_content = description_clean
-
-        # Build selectors based on element type and content
-        selectors = []
-
-        if element_type == 'button':
-            if text_content:
-                selectors.extend([
-                    # Try submit/button inputs first (most specific)
-                    f'input[type="submit"][value*="{text_content}" i]',
-                    f'input[type="button"][value*="{text_content}" i]',
-                    # Then actual button elements
-                    f'button:has-text("{text_content}")',
-                    # Role-based buttons
-                    f'[role="button"]:has-text("{text_content}")',
-                    # Link styled as button
-                    f'a.button:has-text("{text_content}")',
-                    f'a.btn:has-text("{text_content}")',
-                    # Generic class-based buttons
-                    f'*[class*="btn"]:has-text("{text_content}")',
-                    f'*[class*="button"]:has-text("{text_content}")'
-                ])
-            else:
-                selectors.extend(['button', '[role="button"]', 'input[type="submit"]', 'input[type="button"]'])
-
-        elif element_type == 'dropdown' or 'dropdown' in description_lower or 'select' in description_lower:
-            # For dropdown/select elements - try multiple UI framework patterns
-            if text_content:
-                selectors.extend([
-                    # Native HTML select elements (most specific)
-                    f'select[name*="{text_content.lower().replace(" ", "")}" i]',
-                    f'select[id*="{text_content.lower().replace(" ", "")}" i]',
-                    f'select[aria-label*="{text_content}" i]',
-
-                    # Ant Design selects
-                    f'.ant-select:has-text("{text_content}")',
-                    f'.ant-select[aria-label*="{text_content}" i]',
-                    f'input[role="combobox"][id*="{text_content.lower().replace(" ", "-")}" i]',
-
-                    # Material UI selects
-                    f'.MuiSelect-root:has-text("{text_content}")',
-                    f'.MuiInputBase-root:has-text("{text_content}")',
-                    f'div[role="button"][aria-haspopup="listbox"]:has-text("{text_content}")',
-
-                    # Bootstrap selects
-                    f'.custom-select:has-text("{text_content}")',
-                    f'.form-select:has-text("{text_content}")',
-                    f'.dropdown-toggle:has-text("{text_content}")',
-
-                    # React Select
-                    f'.react-select__control:has-text("{text_content}")',
-                    f'.Select__control:has-text("{text_content}")',
-
-                    # Generic ARIA patterns
-                    f'[role="combobox"][aria-label*="{text_content}" i]',
-                    f'[role="listbox"][aria-label*="{text_content}" i]',
-                    f'[role="button"][aria-haspopup="listbox"]:has-text("{text_content}")',
-
-                    # Generic class patterns
-                    f'div[class*="select"][aria-label*="{text_content}" i]',
-                    f'div[class*="dropdown"][aria-label*="{text_content}" i]',
-                    f'*[class*="select"]:has-text("{text_content}")',
-                    f'*[class*="dropdown"]:has-text("{text_content}")',
-
-                    # Label associations
-                    f'label:has-text("{text_content}") + select',
-                    f'label:has-text("{text_content}") + .ant-select',
-                    f'label:has-text("{text_content}") + .MuiSelect-root',
-                    f'label:has-text("{text_content}") + div[class*="select"]',
-                    f'label:has-text("{text_content}") + div[class*="dropdown"]',
-                    f'label:has-text("{text_content}") + [role="combobox"]',
-
-                    # Fallback generic selectors
-                    '.ant-select',
-                    '.MuiSelect-root',
-                    '.custom-select',
-                    '.form-select',
-                    '.react-select__control',
-                    'select',
-                    'input[role="combobox"]',
-                    '[role="combobox"]',
-                    '[role="listbox"]',
-                    '[aria-haspopup="listbox"]'
-                ])
-            else:
-                selectors.extend([
-                    'select',
-                    '.ant-select',
-                    '.MuiSelect-root',
-                    '.custom-select',
-                    '.form-select',
-                    '[role="combobox"]',
-                    '[role="listbox"]'
-                ])
+        description_lower, element_type, text_content = self._analyze_description(description)
 
-        elif element_type == 'input' or element_type is None:
-            # For input fields, try multiple strategies
-            if text_content:
-                # Try different ways to find input fields
-                selectors.extend([
-                    # By placeholder
-                    f'input[placeholder*="{text_content}" i]',
-                    # By aria-label
-                    f'input[aria-label*="{text_content}" i]',
-                    # By id
-                    f'input[id*="{text_content.lower().replace(" ", "")}" i]',
-                    f'input[id*="{text_content.lower().replace(" ", "_")}" i]',
-                    f'input[id*="{text_content.lower().replace(" ", "-")}" i]',
-                    # By name
-                    f'input[name*="{text_content.lower().replace(" ", "")}" i]',
-                    f'input[name*="{text_content.lower().replace(" ", "_")}" i]',
-                    f'input[name*="{text_content.lower().replace(" ", "-")}" i]',
-                    # By label
-                    f'label:has-text("{text_content}") + input',
-                    f'label:has-text("{text_content}") input',
-                    # Generic input near text
-                    f'input:near(:text("{text_content}"))',
-                    # Try with different variations
-                    f'input[placeholder*="{text_content.lower()}" i]',
-                    f'input[aria-label*="{text_content.lower()}" i]',
-
-                    # Rich text editor patterns - Add these
-                    f'div.ant-form-item:has(label:has-text("{text_content}")) [contenteditable="true"]',
-                    f'div.ant-form-item:has(label:has-text("{text_content}")) .ql-editor',
-                    f'div:has(label:has-text("{text_content}")) [contenteditable="true"]',
-                    f'div:has(label:has-text("{text_content}")) .ql-editor',
-                    f'label:has-text("{text_content}") ~ div [contenteditable="true"]',
-                    f'label:has-text("{text_content}") ~ div .ql-editor',
-                    f'[aria-label*="{text_content}" i][contenteditable="true"]',
-                    f'.editor-container:near(:text("{text_content}"))',
-                    f'[role="textbox"]:near(:text("{text_content}"))',
-                    # For cases where the label is separate from the editor
-                    f'div:below(:text("{text_content}"), 100) [contenteditable="true"]',
-                    f'div:below(:text("{text_content}"), 100) .ql-editor'
-                ])
-
-                # Special handling for common field names
-                if 'username' in text_content.lower() or 'user' in text_content.lower():
-                    selectors.extend([
-                        'input[type="text"][name*="user" i]',
-                        'input[type="text"][id*="user" i]',
-                        'input[type="email"]',
-                        'input[autocomplete="username"]'
-                    ])
-                elif 'password' in text_content.lower() or 'pass' in text_content.lower():
-                    selectors.extend([
-                        'input[type="password"]',
-                        'input[name*="pass" i]',
-                        'input[id*="pass" i]',
-                        'input[autocomplete="current-password"]'
-                    ])
-                elif 'email' in text_content.lower():
-                    selectors.extend([
-                        'input[type="email"]',
-                        'input[name*="email" i]',
-                        'input[id*="email" i]'
-                    ])
-                elif 'search' in text_content.lower():
-                    selectors.extend([
-                        # Generic search selectors
-                        'input[type="search"]',
-                        'input#search',
-                        '#search',
-                        'input[name*="search" i]',
-                        'input[id*="search" i]',
-                        'input[placeholder*="search" i]',
-                        'input[aria-label*="search" i]',
-                        'input[role="searchbox"]',
-                        '.search-input',
-                        '.search-field',
-                        'input.search'
-                    ])
-            else:
-                selectors.extend(['input[type="text"]', 'input:not([type="hidden"])'])
+        # Candidate selectors are generated lazily so an early hit skips the rest
+        selectors = self._iter_selectors(element_type, text_content, description_lower)
 
-        elif element_type == 'link':
-            if text_content:
-                selectors.extend([
-                    f'a:has-text("{text_content}")',
-                    f'a[href*="{text_content.lower().replace(" ", "")}" i]'
-                ])
-            else:
-                selectors.append('a')
-
-        # Try each selector
+        # Try each selector in order. Runs of plain CSS selectors are probed as one
+        # union locator in a single round-trip; Playwright-only selectors one by one.
+        css_batch = []
         for selector in selectors:
-            try:
-                elements = page.locator(selector)
-                count = elements.count()
-
-                if count > 0:
-                    # If multiple elements found, try to find the most visible one
-                    for i in range(count):
-                        element = elements.nth(i)
-                        if element.is_visible():
-                            box = element.bounding_box()
-                            if box:
-                                return {
-                                    'type': element_type or 'unknown',
-                                    'selector': f"{selector} >> nth={i}",
-                                    'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
-                                    'bounds': box,
-                                    'confidence': 0.8
-                                }
-            except:
+            if not PLAYWRIGHT_SELECTOR_PATTERN.search(selector):
+                css_batch.append(selector)
                 continue
 
+            hit = self._probe_css_selectors(page, css_batch)
+            css_batch = []
+            if not hit:
+                hit = self._probe_locator(page, selector)
+            if hit:
+                return self._selector_match(element_type, *hit)
+
+        hit = self._probe_css_selectors(page, css_batch)
+        if hit:
+            return self._selector_match(element_type, *hit)
+
         # Generic text search as last resort
         if text_content:
             try:
@@ -394,65 +493,159 @@ class AIElementFinder:
 
                 # Then try generic text search
                 elements = page.locator(f'text="{text_content}"')
-                count = elements.count()
-
-                if count > 0:
-                    # If multiple elements, prefer clickable ones
-                    for i in range(count):
-                        element = elements.nth(i)
-                        tag_name = element.evaluate("el => el.tagName.toLowerCase()")
-
-                        # Prefer button/input/a elements
-                        if tag_name in ['button', 'input', 'a'] or element.get_attribute('role') == 'button':
-                            box = element.bounding_box()
-                            if box:
-                                return {
-                                    'type': 'button' if tag_name in ['button', 'input'] else tag_name,
-                                    'selector': f'text="{text_content}" >> nth={i}',
-                                    'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
-                                    'bounds': box,
-                                    'confidence': 0.8
-                                }
-
-                    # If no clickable element found, return the first visible one
-                    element = elements.first
-                    if element.is_visible():
-                        box = element.bounding_box()
-                        if box:
-                            return {
-                                'type': 'text',
-                                'selector': f'text="{text_content}" >> nth=0',
-                                'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
-                                'bounds': box,
-                                'confidence': 0.6
-                            }
+                infos = elements.evaluate_all(ELEMENT_INFO_JS)
+
+                # If multiple elements, prefer clickable ones
+                for i, info in enumerate(infos):
+                    tag_name = info['tag']
+
+                    # Prefer button/input/a elements
+                    if (tag_name in ('button', 'input', 'a') or info['role'] == 'button') and info['rendered']:
+                        box = info['bounds']
+                        return {
+                            'type': 'button' if tag_name in ('button', 'input') else tag_name,
+                            'selector': f'text="{text_content}" >> nth={i}',
+                            'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
+                            'bounds': box,
+                            'confidence': 0.8
+                        }
+
+                # If no clickable element found, return the first visible one
+                if infos and infos[0]['visible']:
+                    box = infos[0]['bounds']
+                    return {
+                        'type': 'text',
+                        'selector': f'text="{text_content}" >> nth=0',
+                        'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
+                        'bounds': box,
+                        'confidence': 0.6
+                    }
             except Exception as e:
                 print(f"Error in text search: {e}")
                 pass
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _analyze_description(description: str) -> Tuple[str, Optional[str], str]:
+        """Lowercased description, element type and search text, computed once per description"""
+        description_lower = description.lower()
+
+        # Clean up the description - remove extra quotes and field/button suffixes
+        description_clean = description.strip('"\'')
+        description_clean = DESCRIPTION_SUFFIX_PATTERN.sub('', description_clean)
+
+        # Extract key information
+        type_match = ELEMENT_TYPE_CLASSIFIER.match(description_lower)
+        element_type = type_match.lastgroup if type_match else None
+
+        # Extract text content - use the cleaned description as the text to search for
+        return description_lower, element_type, description_clean
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _text_variants(text_content: str) -> Tuple[str, str, str, str]:
+        """Lowercase, no-space, underscore and dash forms of the search text"""
+        tc_lower = text_content.lower()
+        return (tc_lower, tc_lower.replace(" ", ""),
+                tc_lower.replace(" ", "_"), tc_lower.replace(" ", "-"))
+
+    def _probe_css_selectors(self, page, selectors: List[str]) -> Optional[Tuple[str, int, Dict]]:
+        """Find the first visible element for a list of CSS selectors in one round-trip"""
+        if not selectors:
+            return None
+        try:
+            # Playwright's engine (unlike document.querySelectorAll) pierces open
+            # shadow roots and numbers matches the same way as '>> nth='
+            hit = page.locator(', '.join(selectors)).evaluate_all(FIRST_VISIBLE_MATCH_JS, selectors)
+        except PlaywrightError:
+            # One invalid selector fails the whole union; probe them one at a time
+            for selector in selectors:
+                hit = self._probe_locator(page, selector)
+                if hit:
+                    return hit
+            return None
+        if not isinstance(hit, dict):
+            return None
+        return hit['selector'], hit['index'], hit['bounds']
+
+    def _probe_locator(self, page, selector: str) -> Optional[Tuple[str, int, Dict]]:
+        """Find the first visible element for a Playwright selector in one round-trip"""
+        try:
+            # Scan stops in the page at the first visible match; evaluate_all (unlike
+            # locator.first) never waits when nothing matches
+            hit = page.locator(selector).evaluate_all(FIRST_VISIBLE_ELEMENT_JS)
+        except PlaywrightError:
+            return None
+        if not isinstance(hit, dict):
+            return None
+        return selector, hit['index'], hit['bounds']
+
+    def _selector_match(self, element_type: Optional[str], selector: str, index: int, box: Dict) -> Dict:
+        """Build element info for a selector hit"""
+        return {
+            'type': element_type or 'unknown',
+            'selector': f"{selector} >> nth={index}",
+            'position': {'x': box['x'] + box['width']/2, 'y': box['y'] + box['height']/2},
+            'bounds': box,
+            'confidence': 0.8
+        }
+
+    def _iter_selectors(self, element_type: Optional[str], text_content: str,
+                        description_lower: str) -> Iterator[str]:
+        """Lazily yield candidate selectors, most specific first"""
+        if element_type == 'button':
+            family = 'button'
+        elif element_type == 'dropdown' or 'dropdown' in description_lower or 'select' in description_lower:
+            family = 'dropdown'
+        elif element_type == 'input' or element_type is None:
+            family = 'input'
+        elif element_type == 'link':
+            family = 'link'
+        else:
+            return
+
+        templates = SELECTOR_TEMPLATES[family, bool(text_content)]
+        if not text_content:
+            yield from templates
+            return
+
+        # Text variants used across many selectors, shared by repeat lookups
+        tc_lower, tc_nospace, tc_under, tc_dash = self._text_variants(text_content)
+        for template in templates:
+            yield template.format(text=text_content, lower=tc_lower, nospace=tc_nospace,
+                                  under=tc_under, dash=tc_dash)
+
+        if family == 'input':
+            # Special handling for common field names
+            for hints, selectors in INPUT_HINT_SELECTORS:
+                if any(hint in tc_lower for hint in hints):
+                    yield from selectors
+                    break
+
     def _matches_description(self, element_type: str, description: str) -> bool:
         """Check if element type matches description"""
+        return element_type in self._description_types(description)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _description_types(description: str) -> FrozenSet[str]:
+        """Element types implied by any keyword in the description, computed once per description"""
         description_lower = description.lower()
-        type_keywords = {
-            'button': ['button', 'click', 'submit', 'press'],
-            'input': ['input', 'field', 'enter', 'type'],
-            'link': ['link', 'navigate', 'href'],
-            'dropdown': ['dropdown', 'select', 'choose'],
-            'checkbox': ['checkbox', 'check', 'tick'],
-            'radio': ['radio', 'option'],
-            'text': ['text', 'label', 'contains']
-        }
+        if DESCRIPTION_KEYWORD_AUTOMATON is not None:
+            return frozenset(elem_type for _, elem_type in DESCRIPTION_KEYWORD_AUTOMATON.iter(description_lower))
+        return frozenset(elem_type for keyword, elem_type in DESCRIPTION_KEYWORD_TYPES
+                         if keyword in description_lower)
 
-        if element_type in type_keywords:
-            return any(keyword in description_lower for keyword in type_keywords[element_type])
-        return False
+    @staticmethod
+    def _cache_key(url: str, description: str) -> str:
+        """Fixed-size cache key for a url/description pair"""
+        return hashlib.blake2b(f"{url}:{description}".encode('utf-8'), digest_size=16).hexdigest()
 
     def _cache_element(self, key: str, element_info: Dict):
         """Cache element information"""
         if self.cache_manager:
-            self.element_cache[key] = element_info
             self.cache_manager.save_cache(key, element_info)
 
     def click_at_position(self, page, position: Dict):
@@ -1,16 +1,25 @@
 """Browser management and lifecycle"""
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
-from typing import Dict, Optional
+from typing import Mapping, Optional
 import os
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# JPEG quality for screenshots - plenty for reports and detection, far cheaper than PNG
+SCREENSHOT_QUALITY = 70
+
+
+def screenshot_bytes(page: Page) -> bytes:
+    """Viewport JPEG bytes for AI detection, with no file or base64 round-trip"""
+    return page.screenshot(type='jpeg', quality=SCREENSHOT_QUALITY)
+
 
 class BrowserManager:
     """Manages browser instances and contexts"""
 
-    def __init__(self, options: Dict):
+    def __init__(self, options: Mapping):
+        # Options are read-only and shared by reference, never copied
         self.options = options
         self.playwright = None
         self.browser = None
@@ -77,12 +86,12 @@ class BrowserManager:
             return self.context.new_page()
         return None
 
-    def take_screenshot(self, name: str = None) -> str:
-        """Take screenshot of current page"""
+    def take_screenshot(self, name: str = None, full_page: bool = False) -> str:
+        """Take screenshot of current page (viewport JPEG unless full_page is requested)"""
         if not self.page:
             return None
 
         os.makedirs('reports/screenshots', exist_ok=True)
-        path = f"reports/screenshots/{name or 'screenshot'}.png"
-        self.page.screenshot(path=path, full_page=True)
-        return path
\ No newline at end of file
+        path = f"reports/screenshots/{name or 'screenshot'}.jpg"
+        self.page.screenshot(path=path, type='jpeg', quality=SCREENSHOT_QUALITY, full_page=full_page)
+        return path
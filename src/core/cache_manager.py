@@ -1,86 +1,215 @@
 """
 Element cache management for AITestRunner
 """
+import atexit
+import heapq
 import json
 import os
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+# Live managers, flushed by the single exit hook below instead of one
+# atexit registration per instance
+_INSTANCES = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for manager in list(_INSTANCES):
+        manager.flush()
+
+
 class CacheManager:
     """Manages element selector caching"""
 
-    def __init__(self, cache_dir: str = "config/mapping", ttl: int = 86400):
+    def __init__(self, cache_dir: str = "config/mapping", ttl: int = 86400,
+                 flush_interval: float = 1.0, maxsize: int = 10000):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl  # Time to live in seconds
-        self.cache = {}
+        self.flush_interval = flush_interval  # Max seconds between disk writes
+        self.maxsize = maxsize  # Least recently used entries are evicted beyond this
+        self.cache = OrderedDict()
         self.project_name = None
 
+        # (expires_at, key) min-heap so expiry never scans the whole cache
+        self._expiry_heap = []
+        self._lock = threading.RLock()
+        self._flush_timer = None
+        # Keys written since the last flush, and the number of lines in the log file
+        self._pending_keys = OrderedDict()
+        self._log_lines = 0
+        _INSTANCES.add(self)
+
     def set_project(self, project_name: str):
         """Set project name for cache file"""
         self.project_name = project_name.lower().replace(' ', '_')
         self._load_cache()
 
+    def _cache_file(self) -> Path:
+        """Append-only NDJSON log holding one cache write per line"""
+        return self.cache_dir / f"{self.project_name}_cache.ndjson"
+
     def _load_cache(self):
-        """Load cache from file"""
+        """Load cache by replaying the log - the last write per key wins"""
         if not self.project_name:
             return
 
-        cache_file = self.cache_dir / f"{self.project_name}_cache.json"
+        cache_file = self._cache_file()
         if cache_file.exists():
             try:
-                with open(cache_file, 'r') as f:
-                    self.cache = json.load(f)
-                    self._clean_expired()
+                cache = OrderedDict()
+                lines = 0
+                torn = False
+                with open(cache_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            entry = orjson.loads(line) if orjson else json.loads(line)
+                        except ValueError:
+                            # A torn line from an interrupted write
+                            torn = True
+                            continue
+                        lines += 1
+                        cache[entry['k']] = {'value': entry['v'], 'timestamp': entry['ts']}
+                        cache.move_to_end(entry['k'])
+                # Entries evicted in earlier runs may still be in the log
+                while len(cache) > self.maxsize:
+                    cache.popitem(last=False)
+                with self._lock:
+                    self.cache = cache
+                    self._log_lines = lines
+                    self._expiry_heap = [(data['timestamp'] + self.ttl, key)
+                                         for key, data in self.cache.items()]
+                    heapq.heapify(self._expiry_heap)
+                    if torn:
+                        # Rewrite now so later appends don't land on the torn line
+                        self._compact()
+                self._clean_expired()
             except Exception as e:
                 print(f"Error loading cache: {e}")
-                self.cache = {}
+                self.cache = OrderedDict()
+                self._expiry_heap = []
+                self._log_lines = 0
+
+    @staticmethod
+    def _encode_entry(key: str, data: Dict[str, Any]) -> bytes:
+        """One NDJSON log line for a cache entry"""
+        entry = {'k': key, 'v': data['value'], 'ts': data['timestamp']}
+        if orjson:
+            return orjson.dumps(entry) + b'\n'
+        return json.dumps(entry, separators=(',', ':')).encode('utf-8') + b'\n'
 
     def _save_cache(self):
-        """Save cache to file"""
+        """Append pending writes to the log, compacting it once it is mostly dead lines"""
         if not self.project_name:
             return
 
-        cache_file = self.cache_dir / f"{self.project_name}_cache.json"
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            with self._lock:
+                if self._log_lines > 2 * len(self.cache):
+                    self._compact()
+                elif self._pending_keys:
+                    lines = [self._encode_entry(key, self.cache[key])
+                             for key in self._pending_keys if key in self.cache]
+                    with open(self._cache_file(), 'ab') as f:
+                        f.write(b''.join(lines))
+                    self._log_lines += len(lines)
+                self._pending_keys = OrderedDict()
         except Exception as e:
             print(f"Error saving cache: {e}")
 
+    def _compact(self):
+        """Rewrite the log with only live entries"""
+        cache_file = self._cache_file()
+        tmp_file = cache_file.with_suffix('.tmp')
+        data = b''.join(self._encode_entry(key, entry) for key, entry in self.cache.items())
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, cache_file)
+        self._log_lines = len(self.cache)
+
+    def _schedule_save(self):
+        """Coalesce writes so the log is appended at most once per flush interval"""
+        with self._lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write pending cache changes to disk now"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._save_cache()
+
     def _clean_expired(self):
         """Remove expired cache entries"""
         current_time = datetime.now().timestamp()
-        expired_keys = []
+        removed = False
 
-        for key, data in self.cache.items():
-            if current_time - data.get('timestamp', 0) > self.ttl:
-                expired_keys.append(key)
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < current_time:
+                _, key = heapq.heappop(heap)
+                data = self.cache.get(key)
+                # Skip stale heap entries for keys that were re-saved since
+                if data is not None and current_time - data.get('timestamp', 0) > self.ttl:
+                    del self.cache[key]
+                    removed = True
 
-        for key in expired_keys:
-            del self.cache[key]
-
-        if expired_keys:
-            self._save_cache()
+        if removed:
+            self._schedule_save()
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get cached element info"""
-        if key in self.cache:
-            data = self.cache[key]
+        data = self.cache.get(key)
+        if data is not None:
             if datetime.now().timestamp() - data.get('timestamp', 0) <= self.ttl:
+                with self._lock:
+                    if key in self.cache:
+                        self.cache.move_to_end(key)
                 return data.get('value')
         return None
 
     def save_cache(self, key: str, value: Dict[str, Any]):
         """Save element info to cache"""
-        self.cache[key] = {
-            'value': value,
-            'timestamp': datetime.now().timestamp()
-        }
-        self._save_cache()
+        timestamp = datetime.now().timestamp()
+        with self._lock:
+            self.cache[key] = {
+                'value': value,
+                'timestamp': timestamp
+            }
+            self.cache.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (timestamp + self.ttl, key))
+            self._pending_keys[key] = None
+            while len(self.cache) > self.maxsize:
+                # Stale heap and pending entries for the evicted key are skipped later
+                self.cache.popitem(last=False)
+        self._clean_expired()
+        self._schedule_save()
 
     def clear_cache(self):
         """Clear all cache"""
-        self.cache = {}
-        self._save_cache()
\ No newline at end of file
+        with self._lock:
+            self.cache = OrderedDict()
+            self._expiry_heap = []
+            self._pending_keys = OrderedDict()
+        self.flush()
+
+    def close(self):
+        """Flush pending writes and drop the manager from the exit hook"""
+        self.flush()
+        _INSTANCES.discard(self)
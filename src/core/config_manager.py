@@ -1,12 +1,95 @@
 """Configuration management"""
+import copy
 import os
+import re
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, Union
 from src.utils.logger import setup_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = setup_logger(__name__)
 
+# Sentinels for get(): not cached yet / cached as absent from the config
+_MISSING = object()
+_NOT_FOUND = object()
+
+# ${VAR} references, substituted anywhere inside config strings
+ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# (resolved path, mtime_ns, size) -> (parsed YAML, paths of strings holding ${VAR}
+# references), shared by every ConfigManager in the process
+_YAML_CACHE: 'OrderedDict[Tuple[str, int, int], Tuple[Any, Tuple[tuple, ...]]]' = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a config tree read-only: dicts become MappingProxyType views, lists tuples
+
+    MappingProxyType can't be deepcopied or pickled, so the frozen config can't
+    either; consumers needing that must build a plain dict from the values.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _env_var_paths(tree: Any) -> Tuple[tuple, ...]:
+    """Key/index paths of every string in a parsed YAML tree that contains '${'"""
+    paths = []
+    stack = [((), tree)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (k,), v) for k, v in node.items())
+        elif isinstance(node, list):
+            stack.extend((path + (i,), v) for i, v in enumerate(node))
+        elif isinstance(node, str) and '${' in node:
+            paths.append(path)
+    return tuple(paths)
+
+
+def _load_yaml(path: Path) -> Tuple[Any, Tuple[tuple, ...]]:
+    """
+    Parse a YAML file, reusing the parsed result until the file changes
+
+    Also returns the paths of strings containing '${', so env var processing
+    touches only those leaves. Files without '${' in their raw bytes are never walked.
+    """
+    resolved = path.resolve()
+    stat = resolved.stat()
+    key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+    entry = _YAML_CACHE.get(key)
+    if entry is not None:
+        _YAML_CACHE.move_to_end(key)
+    else:
+        # libyaml decodes the raw bytes itself, skipping the io text layer
+        with open(resolved, 'rb') as f:
+            raw = f.read()
+        data = yaml.load(raw, Loader=_YamlLoader)
+        entry = _YAML_CACHE[key] = (data, _env_var_paths(data) if b'${' in raw else ())
+        # Bounded, so superseded revisions of edited files don't pile up
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    data, env_paths = entry
+    # Callers mutate the result (overrides are popped, sections merged)
+    return copy.deepcopy(data), env_paths
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """Parse a YAML file through the shared cache, returning a private copy"""
+    return _load_yaml(Path(path))[0]
+
 
 class ConfigManager:
     """Manages configuration loading and merging"""
@@ -15,85 +98,93 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.environment = environment
         self.config = {}
+        # Dotted key -> resolved value (or _MISSING), reset whenever config is reloaded
+        self._get_cache: Dict[str, Any] = {}
 
-    def load_config(self) -> Dict[str, Any]:
+    def load_config(self) -> Mapping:
         """Load and merge configuration files"""
+        env_paths = []
+        config = {}
+
         # Load main config
         if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            config, main_env_paths = _load_yaml(self.config_path)
+            env_paths.extend(main_env_paths)
 
         # Load environment specific config
         env_config_path = self.config_path.parent / 'environments' / f'{self.environment}.yaml'
         if env_config_path.exists():
-            with open(env_config_path, 'r') as f:
-                env_config = yaml.safe_load(f)
-
-                # Handle overrides section specially
-                if 'overrides' in env_config:
-                    overrides = env_config.pop('overrides')
-                    # Apply overrides to base config first
-                    self._apply_overrides(self.config, overrides)
-
-                # Then merge the rest of env config
-                self.config = self._merge_configs(self.config, env_config)
+            env_config, env_file_paths = _load_yaml(env_config_path)
+            # Leaves under 'overrides' land one level up in the merged config
+            env_paths.extend(path[1:] if path[0] == 'overrides' else path
+                             for path in env_file_paths)
+
+            # Handle overrides section specially: applied first, and only one level
+            # deep (each section's keys are replaced, not merged)
+            overrides = env_config.pop('overrides', None)
+            if overrides:
+                self._merge_into(config, overrides, max_depth=1)
+
+            # Then deep merge the rest of env config. Both configs are private
+            # copies, so the merge can happen in place.
+            self._merge_into(config, env_config)
         else:
             logger.warning(f"Environment config not found: {env_config_path}")
 
-        # Process environment variables
-        self.config = self._process_env_vars(self.config)
+        # Process environment variables - only at the leaves that reference one
+        for path in env_paths:
+            self._substitute_at(config, path)
 
+        # Read-only view shared by every consumer (executors, action handlers)
+        # without defensive copies
+        self.config = _freeze(config)
+        self._get_cache.clear()
         logger.info(f"Configuration loaded for environment: {self.environment}")
         return self.config
 
-    def _merge_configs(self, base: Dict, override: Dict) -> Dict:
-        """Deep merge two dictionaries"""
-        result = base.copy()
+    def _merge_into(self, target: Dict, override: Dict, max_depth: Optional[int] = None) -> None:
+        """
+        Recursively merge override into target without copying
 
+        Below max_depth levels of nesting, values replace instead of merging.
+        """
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
+            # One lookup per key; exact type checks are safe as YAML only yields plain dicts
+            current = target.get(key)
+            if max_depth != 0 and type(current) is dict and type(value) is dict:
+                self._merge_into(current, value, None if max_depth is None else max_depth - 1)
             else:
-                result[key] = value
-
-        return result
-
-    def _apply_overrides(self, base: Dict, overrides: Dict) -> None:
-        """Apply overrides from environment config to base config"""
-        for section, values in overrides.items():
-            if section in base and isinstance(values, dict):
-                if isinstance(base[section], dict):
-                    # Merge the override values into the base section
-                    for key, value in values.items():
-                        base[section][key] = value
-                else:
-                    # Replace the entire value if base is not a dict
-                    base[section] = values
-            else:
-                # Add new section if it doesn't exist in base
-                base[section] = values
-
-    def _process_env_vars(self, config: Any) -> Any:
-        """Replace ${VAR} with environment variables"""
-        if isinstance(config, dict):
-            return {k: self._process_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._process_env_vars(item) for item in config]
-        elif isinstance(config, str) and config.startswith('${') and config.endswith('}'):
-            var_name = config[2:-1]
-            return os.environ.get(var_name, config)
-        else:
-            return config
+                target[key] = value
+
+    def _substitute_at(self, config: Any, path: tuple) -> None:
+        """Expand ${VAR} references in the string at path, if it survived the merge"""
+        parent = config
+        try:
+            for key in path[:-1]:
+                parent = parent[key]
+            value = parent[path[-1]]
+        except (KeyError, IndexError, TypeError):
+            return
+        if isinstance(value, str):
+            parent[path[-1]] = self._substitute_env_vars(value)
+
+    def _substitute_env_vars(self, value: str) -> str:
+        """Expand ${VAR} references in one string; unset variables are left as-is"""
+        if '${' not in value:
+            return value
+        return ENV_VAR_PATTERN.sub(lambda m: os.environ.get(m.group(1), m.group(0)), value)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key (supports dot notation)"""
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        value = self._get_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.config
+            for k in key.split('.'):
+                if isinstance(value, Mapping) and k in value:
+                    value = value[k]
+                else:
+                    value = _NOT_FOUND
+                    break
+            self._get_cache[key] = value
 
-        return value
\ No newline at end of file
+        return default if value is _NOT_FOUND else value
@@ -1,38 +1,81 @@
 """Custom action handlers for complex operations"""
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 from playwright.sync_api import Page
 
+# Fills the login form and submits it in one round-trip (used when fast_login is set)
+FAST_LOGIN_JS = """
+([username, password]) => {
+    const fill = (selector, value) => {
+        const input = document.querySelector(selector);
+        if (!input) throw new Error(`Login field not found: ${selector}`);
+        input.value = value;
+        input.dispatchEvent(new Event('input', {bubbles: true}));
+        input.dispatchEvent(new Event('change', {bubbles: true}));
+    };
+    fill('input[name="username"], input[type="email"]', username);
+    fill('input[name="password"], input[type="password"]', password);
+    const submit = document.querySelector('button[type="submit"], input[type="submit"]');
+    if (!submit) throw new Error('Login submit button not found');
+    submit.click();
+}
+"""
+
+# True once the cart badge shows at least the expected count
+CART_COUNT_REACHED_JS = """
+([selector, expected]) => {
+    const counter = document.querySelector(selector);
+    return counter !== null && parseInt(counter.innerText, 10) >= expected;
+}
+"""
+
 
 class ActionHandler:
     """Handles complex custom actions"""
 
-    def __init__(self, page: Page, config: Dict):
+    def __init__(self, page: Page, config: Mapping):
+        # config is the read-only view from ConfigManager and is shared, not copied
         self.page = page
         self.config = config
 
+        # Config is fixed for the handler's lifetime, so resolve login data once
+        self._users_by_name = {}
+        for user in config.get('test_data', {}).get('users', []):
+            username = user.get('username')
+            if username is None:
+                continue
+            # First entry wins, as with the previous linear scan
+            self._users_by_name.setdefault(username, user)
+
+        login_url = config.get('pages', {}).get('login', '/login')
+        if not login_url.startswith('http'):
+            login_url = f"{config.get('base_url', '')}{login_url}"
+        self._login_url = login_url
+        # Skips Playwright's per-call actionability checks; opt in via config
+        self._fast_login = bool(config.get('fast_login', False))
+        # Cart badge add_to_cart waits on; without one it keeps the fixed delay
+        self._cart_count_selector = config.get('cart_count_selector')
+        self.timeout = config.get('timeout', 30000)
+
     def login(self, params: Dict) -> Dict:
         """Custom login action"""
         username = params.get('username', '')
 
         # Get user data from config
-        users = self.config.get('test_data', {}).get('users', [])
-        user_data = next((u for u in users if u['username'] == username), None)
+        user_data = self._users_by_name.get(username)
 
         if not user_data:
             raise Exception(f"User not found in test data: {username}")
 
         # Navigate to login page
-        login_url = self.config.get('pages', {}).get('login', '/login')
-        if not login_url.startswith('http'):
-            base_url = self.config.get('base_url', '')
-            login_url = f"{base_url}{login_url}"
-
-        self.page.goto(login_url)
+        self.page.goto(self._login_url)
 
         # Fill login form
-        self.page.fill('input[name="username"], input[type="email"]', username)
-        self.page.fill('input[name="password"], input[type="password"]', user_data['password'])
-        self.page.click('button[type="submit"], input[type="submit"]')
+        if self._fast_login:
+            self.page.evaluate(FAST_LOGIN_JS, [username, user_data['password']])
+        else:
+            self.page.fill('input[name="username"], input[type="email"]', username)
+            self.page.fill('input[name="password"], input[type="password"]', user_data['password'])
+            self.page.click('button[type="submit"], input[type="submit"]')
 
         # Wait for navigation
         self.page.wait_for_load_state('networkidle')
@@ -43,8 +86,22 @@ class ActionHandler:
         """Add items to cart"""
         quantity = int(params.get('quantity', 1))
 
+        # Wait on the configured cart badge when the page has it, otherwise fall back to a fixed delay
+        counter = self.page.query_selector(self._cart_count_selector) if self._cart_count_selector else None
+        start = None
+        if counter:
+            try:
+                start = int(counter.inner_text().strip() or 0)
+            except ValueError:
+                start = None
+
         for i in range(quantity):
             self.page.click('button:has-text("Add to Cart")')
-            self.page.wait_for_timeout(500)
+            if start is None:
+                self.page.wait_for_timeout(500)
+            else:
+                self.page.wait_for_function(CART_COUNT_REACHED_JS,
+                                            arg=[self._cart_count_selector, start + i + 1],
+                                            timeout=self.timeout)
 
         return {'added_to_cart': quantity}
\ No newline at end of file
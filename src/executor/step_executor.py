@@ -1,20 +1,288 @@
 """
 Step executor that handles the actual browser interactions
 """
+import logging
 import re
 import time
 import datetime
 import asyncio
+import threading
 import time
 from typing import Dict, Any, Optional, List
 from playwright.sync_api import Page, ElementHandle
 from src.core.ai_element_finder import AIElementFinder
+from src.core.browser_manager import screenshot_bytes
 from src.utils.logger import setup_logger
 import os
-from jsonpath_ng import parse
+from src.utils.helpers import jsonpath_compile
 
 logger = setup_logger(__name__)
 
+# API coroutines all run on one long-lived event loop in a daemon thread, so the aiohttp
+# session created by APIExecutor.initialize() stays usable across steps. A fresh
+# asyncio.run() per call would bind the session to a loop that is closed straight after.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+# Seconds to wait for the API session to be created
+API_INIT_TIMEOUT = 30
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """The shared API event loop, started on first use"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='api-event-loop', daemon=True).start()
+            _background_loop = loop
+    return _background_loop
+
+# Quoted text inside a click step description, e.g. click on "Save"
+DOUBLE_QUOTED_PATTERN = re.compile(r'"([^"]+)"')
+SINGLE_QUOTED_PATTERN = re.compile(r"'([^']+)'")
+
+# Element-type words stripped from an unquoted click description
+CLICK_DESCRIPTION_SUFFIXES = (' link', ' button', ' tab', ' menu', ' item')
+
+# Click selectors in priority groups; {t} is the text being searched for. Each group is
+# queried as one comma-separated union and its matches ranked by CLICK_TAG_PRIORITY.
+CLICK_SELECTOR_GROUPS = (
+    # Exact text matches
+    (
+        'a:text-is("{t}")',
+        'button:text-is("{t}")',
+        '[role="button"]:text-is("{t}")',
+        '[role="link"]:text-is("{t}")',
+    ),
+    # Links and buttons
+    (
+        'a:has-text("{t}"):has-text("{t}")',  # Double check for exact match
+        'a[href*="{t}"]',  # Link with href containing the text
+        'button:has-text("{t}")',
+        'input[type="button"][value*="{t}" i]',
+        'input[type="submit"][value*="{t}" i]',
+        'button[type="submit"]:has-text("{t}")',
+        'button[type="button"]:has-text("{t}")',
+        'a:has-text("{t}")',
+        'a[href]:has-text("{t}")',
+        'a[title*="{t}" i]',
+    ),
+    # Links in table cells (important for data grids) and elements with click handlers
+    (
+        'td a:has-text("{t}")',
+        'th a:has-text("{t}")',
+        '.ant-table-cell a:has-text("{t}")',
+        '[role="gridcell"] a:has-text("{t}")',
+        '[role="cell"] a:has-text("{t}")',
+        '[onclick]:has-text("{t}")',
+        '[ng-click]:has-text("{t}")',
+        '[data-click]:has-text("{t}")',
+        '[role="button"]:has-text("{t}")',
+        '[role="link"]:has-text("{t}")',
+        '[role="menuitem"]:has-text("{t}")',
+        '[role="tab"]:has-text("{t}")',
+    ),
+    # Table cells (clickable data), UI framework buttons and generic clickable classes
+    (
+        'td:has-text("{t}")',
+        'th:has-text("{t}")',
+        'td button:has-text("{t}")',
+        'td:has-text("{t}") a',  # Link inside td with text
+        'tbody td:has-text("{t}")',  # Body cell with text
+        '.btn:has-text("{t}")',  # Bootstrap
+        '.ant-btn:has-text("{t}")',  # Ant Design
+        '.MuiButton-root:has-text("{t}")',  # Material UI
+        '.clickable:has-text("{t}")',
+        '.link:has-text("{t}")',
+        '[class*="click"]:has-text("{t}")',
+        '[class*="button"]:has-text("{t}")',
+    ),
+    # Structural elements that might be clickable. :has-text also matches every ancestor
+    # of the text, so only the innermost element of each tag is kept.
+    (
+        'li:has-text("{t}"):not(:has(li:has-text("{t}")))',
+        'span:has-text("{t}"):not(:has(span:has-text("{t}")))',
+        'div:has-text("{t}"):not(:has(div:has-text("{t}")))',
+        'p:has-text("{t}"):not(:has(p:has-text("{t}")))',
+    ),
+    # Generic visible element, innermost only
+    (
+        '*:has-text("{t}"):visible:not(:has(*:has-text("{t}")))',
+    ),
+)
+
+# Tag, role, visibility (as Playwright's is_visible) and clickability of every click
+# candidate in one round-trip; clickable means the element or one of its 3 nearest ancestors is
+CLICK_CANDIDATES_JS = """
+(elements) => {
+    const isClickable = (el) => {
+        // Check if element itself is clickable
+        if (el.onclick || el.href || el.type === 'button' || el.type === 'submit' ||
+            el.tagName === 'A' || el.tagName === 'BUTTON' ||
+            el.role === 'button' || el.role === 'link' ||
+            el.style.cursor === 'pointer') {
+            return true;
+        }
+
+        // Check if any parent (up to 3 levels) is clickable
+        let parent = el.parentElement;
+        let levels = 0;
+        while (parent && levels < 3) {
+            if (parent.onclick || parent.href || parent.tagName === 'A' ||
+                parent.tagName === 'BUTTON' || parent.role === 'button' ||
+                parent.role === 'link') {
+                return true;
+            }
+            parent = parent.parentElement;
+            levels++;
+        }
+
+        return false;
+    };
+
+    return elements.map((el) => {
+        const rect = el.getBoundingClientRect();
+        const visible = rect.width > 0 && rect.height > 0 &&
+                        getComputedStyle(el).visibility !== 'hidden';
+        return {
+            tag: el.tagName.toLowerCase(),
+            role: el.getAttribute('role'),
+            visible: visible,
+            clickable: visible && isClickable(el)
+        };
+    });
+}
+"""
+
+# Count plus text/href of the first few elements, for debug logging in one round-trip
+ELEMENT_SUMMARY_JS = """
+(elements, limit) => ({
+    count: elements.length,
+    items: elements.slice(0, limit).map((el) => ({text: el.textContent, href: el.getAttribute('href')}))
+})
+"""
+
+# Viewport centre of the first visible element (as Playwright's is_visible), or null
+FIRST_VISIBLE_CENTER_JS = """
+(elements) => {
+    for (const el of elements) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden') {
+            return {x: rect.x + rect.width / 2, y: rect.y + rect.height / 2};
+        }
+    }
+    return null;
+}
+"""
+
+# Common indicators of main content inside an iframe, checked in order
+FRAME_CONTENT_INDICATORS = (
+    'body > div',  # Common container
+    'main',  # Main content area
+    '[role="main"]',  # ARIA main
+    '.container',  # Common container class
+    '.content',  # Common content class
+    'form',  # Forms often in iframes
+    '.ant-layout',  # Ant Design layout
+)
+
+# For every iframe: the first content indicator found, or accessible=false when its
+# document is cross-origin
+FRAME_CONTENT_PROBE_JS = """
+(indicators) => Array.from(document.querySelectorAll('iframe'), (iframe, index) => {
+    let doc = null;
+    try {
+        doc = iframe.contentDocument;
+    } catch (e) {}
+    if (!doc) {
+        return {index: index, accessible: false};
+    }
+    return {
+        index: index,
+        accessible: true,
+        indicator: indicators.find((selector) => doc.querySelector(selector)) || null
+    };
+})
+"""
+
+# Extra groups for prefixes of long texts that may be truncated in the UI
+PARTIAL_CLICK_SELECTOR_GROUPS = (
+    # Links, in table cells first
+    (
+        'td a:has-text("{t}")',
+        '.ant-table-cell a:has-text("{t}")',
+        '[role="gridcell"] a:has-text("{t}")',
+        'tbody a:has-text("{t}")',
+        'a:has-text("{t}")',
+    ),
+    # Then other elements
+    (
+        'button:has-text("{t}")',
+        'td:has-text("{t}")',
+        '[onclick]:has-text("{t}")',
+    ),
+    # Generic visible element, innermost only
+    (
+        '*:has-text("{t}"):visible:not(:has(*:has-text("{t}")))',
+    ),
+)
+
+CLICK_SELECTOR_UNIONS = tuple(', '.join(group) for group in CLICK_SELECTOR_GROUPS)
+PARTIAL_CLICK_SELECTOR_UNIONS = tuple(', '.join(group) for group in PARTIAL_CLICK_SELECTOR_GROUPS)
+
+# Label-anchored input selectors in priority groups; {d} is the field description
+LABEL_INPUT_SELECTOR_GROUPS = (
+    # Editors next to the label, in its parent or in its Ant Design form item
+    (
+        'label:has-text("{d}") + div [contenteditable="true"]',
+        'label:has-text("{d}") + div .ql-editor',
+        'label:has-text("{d}") ~ div [contenteditable="true"]',
+        'label:has-text("{d}") ~ div .ql-editor',
+        'div:has(> label:has-text("{d}")) > div [contenteditable="true"]',
+        'div:has(> label:has-text("{d}")) > div .ql-editor',
+        '.ant-form-item:has(label:has-text("{d}")) > .ant-form-item-control [contenteditable="true"]',
+        '.ant-form-item:has(label:has-text("{d}")) > .ant-form-item-control .ql-editor',
+        '.ant-form-item:has(label:text-is("{d}")) [contenteditable="true"]',
+        '.ant-form-item:has(label:text-is("{d}")) .ql-editor',
+    ),
+    # Chained selectors can't join a CSS union, so each is its own group
+    ('label:has-text("{d}") >> xpath=following-sibling::div[1] >> [contenteditable="true"]',),
+    ('label:has-text("{d}") >> xpath=following-sibling::div[1] >> .ql-editor',),
+    # Dynamic fields that appear after radio/checkbox selection, or in conditionally shown containers
+    (
+        '*[style*="display: block"] label:has-text("{d}") + input',
+        '*[style*="display: block"] label:has-text("{d}") ~ input',
+        '*:not([style*="display: none"]) label:has-text("{d}") + input',
+        '*:not([hidden]) label:has-text("{d}") + input',
+        '.show label:has-text("{d}") + input',
+        '.active label:has-text("{d}") + input',
+        '[class*="visible"] label:has-text("{d}") + input',
+        '[class*="expanded"] label:has-text("{d}") + input',
+    ),
+    # Number inputs and inputs in form groups that may be dynamically shown
+    (
+        'label:has-text("{d}") + input[type="number"]',
+        'label:has-text("{d}") ~ input[type="number"]',
+        'input[type="number"][aria-label*="{d}" i]',
+        '.form-group:not([style*="display: none"]) label:has-text("{d}") + input',
+        '[class*="form-field"]:not([style*="display: none"]) label:has-text("{d}") + input',
+    ),
+)
+
+# Each group as one query matching only visible elements
+LABEL_INPUT_SELECTOR_UNIONS = tuple(', '.join(f'{selector}:visible' for selector in group)
+                                    for group in LABEL_INPUT_SELECTOR_GROUPS)
+
+# Rank of a union's matches by how likely each is the intended click target; ties keep
+# DOM order. Elements with role=button rank just after real buttons.
+CLICK_TAG_PRIORITY = {'a': 0, 'button': 1, 'td': 3, 'th': 3, 'li': 4, 'span': 5, 'div': 6, 'p': 7}
+ROLE_BUTTON_PRIORITY = 2
+DEFAULT_CLICK_PRIORITY = 8
+
+# Generic structural matches that only count when they (or a near ancestor) are clickable
+UNCLICKABLE_TAGS = ('div', 'span')
+
 class StepExecutor:
     """Execute individual test steps using AI-powered element detection"""
 
@@ -24,62 +292,58 @@ class StepExecutor:
         self.config = config
         self.timeout = config.get('timeout', 30000)  # 30 seconds default
         self.wait_time = config.get('wait_time', 500)  # 500ms default
+        # Per-action waits (seconds) resolved once; _wait_after_action is on every step
+        wait_config = config.get('wait_after_actions', {})
+        self._default_wait = wait_config.get('default', 0.5)
+        self._action_waits = {action: wait for action, wait in wait_config.items() if action != 'default'}
         self.api_executor = None
+        self._api_warmup = None
+        self._api_used = False
         api_config_path = config.get('api_config_path', 'config/api_config.yaml')
         if os.path.exists(api_config_path):
             from src.executor.api_executor import APIExecutor
             self.api_executor = APIExecutor(api_config_path, config.get('env', 'dev'))
-            # Initialize async session
-            # asyncio.run(self.api_executor.initialize())
+            # Open the pooled session in the background so the first API step finds it ready
+            self._api_warmup = asyncio.run_coroutine_threadsafe(
+                self.api_executor.initialize(), _get_background_loop())
 
         # Store for last API response
         self.last_api_response = None
         self.current_test_name = None
         self.current_frame = None
         self.main_frame = page.main_frame
+        # action -> bound _handle_<action> method, resolved once instead of per step
+        self._handlers = {name[len('_handle_'):]: getattr(self, name)
+                          for name in dir(self) if name.startswith('_handle_')}
 
 
     def _ensure_correct_frame(self):
         """Automatically switch to the correct frame if content is in an iframe"""
         try:
-            # Check if there are iframes on the page
-            iframes = self.page.locator('iframe').all()
-
-            if not iframes:
+            # One in-browser pass over every iframe instead of a locator count per indicator
+            frames = self.page.evaluate(FRAME_CONTENT_PROBE_JS, list(FRAME_CONTENT_INDICATORS))
+            if not frames:
                 return self.page
 
-            # For each iframe, check if it contains substantial content
-            for iframe_element in iframes:
+            iframes = self.page.locator('iframe')
+            for info in frames:
                 try:
-                    frame = iframe_element.content_frame()
-                    if frame:
-                        # Check if this frame has meaningful content
-                        # Look for common indicators of main content
-                        indicators = [
-                            'body > div',  # Common container
-                            'main',  # Main content area
-                            '[role="main"]',  # ARIA main
-                            '.container',  # Common container class
-                            '.content',  # Common content class
-                            'form',  # Forms often in iframes
-                            '.ant-layout',  # Ant Design layout
-                        ]
-
-                        for indicator in indicators:
-                            if frame.locator(indicator).count() > 0:
-                                logger.debug(f"Found content indicator '{indicator}' in iframe, switching context")
-                                self.current_frame = frame
-                                return frame
-
-                        # If no specific indicators, check if frame has more elements than main page
-                        frame_elements = frame.locator('*').count()
-                        main_elements = self.page.main_frame.locator('*').count()
+                    if info['accessible']:
+                        if not info['indicator']:
+                            continue
+                        reason = f"content indicator '{info['indicator']}'"
+                        frame = iframes.nth(info['index']).element_handle().content_frame()
+                    else:
+                        # Cross-origin document: only Playwright can look inside it
+                        frame = iframes.nth(info['index']).element_handle().content_frame()
+                        reason = frame and self._frame_content_reason(frame)
+                        if not reason:
+                            continue
 
-                        if frame_elements > main_elements * 0.5:
-                            logger.debug(
-                                f"Iframe has substantial content ({frame_elements} elements), switching context")
-                            self.current_frame = frame
-                            return frame
+                    if frame:
+                        logger.debug(f"Iframe has {reason}, switching context")
+                        self.current_frame = frame
+                        return frame
 
                 except Exception as e:
                     logger.debug(f"Could not check iframe: {e}")
@@ -91,6 +355,14 @@ class StepExecutor:
             logger.debug(f"Frame detection error: {e}")
             return self.page
 
+    @staticmethod
+    def _frame_content_reason(frame) -> Optional[str]:
+        """Why a (cross-origin) frame looks like the main content, or None"""
+        for indicator in FRAME_CONTENT_INDICATORS:
+            if frame.locator(indicator).count() > 0:
+                return f"content indicator '{indicator}'"
+        return None
+
     def _find_element_in_frames(self, selector: str, timeout: int = 5000):
         """Try to find element in main frame and all iframes"""
         start_time = time.time()
@@ -98,41 +370,35 @@ class StepExecutor:
         # First try current frame if set
         if self.current_frame:
             try:
-                element = self.current_frame.locator(selector)
-                if element.count() > 0:
-                    first = element.first
-                    if first.is_visible():
-                        return first, self.current_frame
+                first = self.current_frame.locator(selector).first
+                if first.is_visible():
+                    return first, self.current_frame
             except:
                 pass
 
         # Then try main frame
         try:
-            element = self.page.locator(selector)
-            if element.count() > 0:
-                first = element.first
-                if first.is_visible():
-                    self.current_frame = None  # Reset to main frame
-                    return first, self.page
+            first = self.page.locator(selector).first
+            if first.is_visible():
+                self.current_frame = None  # Reset to main frame
+                return first, self.page
         except:
             pass
 
-        # Then try each iframe
-        iframes = self.page.locator('iframe').all()
-        for iframe_element in iframes:
+        # Then try each iframe, nested ones included; Playwright already tracks them all
+        for frame in self.page.frames:
+            if frame is self.page.main_frame:
+                continue
             if time.time() - start_time > timeout / 1000:
                 break
 
             try:
-                frame = iframe_element.content_frame()
-                if frame:
-                    element = frame.locator(selector)
-                    if element.count() > 0:
-                        first = element.first
-                        if first.is_visible():
-                            self.current_frame = frame
-                            logger.debug(f"Found element in iframe, auto-switching context")
-                            return first, frame
+                if not frame.is_detached():
+                    first = frame.locator(selector).first
+                    if first.is_visible():
+                        self.current_frame = frame
+                        logger.debug(f"Found element in iframe, auto-switching context")
+                        return first, frame
             except:
                 continue
 
@@ -152,7 +418,7 @@ class StepExecutor:
             logger.info(f"Executing action: {action} with params: {parameters}")
 
             # Map action to handler method
-            handler = getattr(self, f"_handle_{action}", None)
+            handler = self._handlers.get(action)
             if handler:
                 result = handler(parameters)
 
@@ -184,30 +450,28 @@ class StepExecutor:
                 'screenshot': self._take_screenshot()
             }
 
+    @staticmethod
+    def _run_async(coro, timeout: Optional[float] = None):
+        """Run a coroutine on the shared background loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result(timeout)
+
     def _ensure_api_executor_initialized(self):
         """Ensure API executor is initialized when needed"""
+        if self._api_warmup is not None:
+            warmup, self._api_warmup = self._api_warmup, None
+            warmup.result(API_INIT_TIMEOUT)
         if self.api_executor and not self.api_executor.session:
-            # Create new event loop if needed
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is already running, create task
-                    asyncio.create_task(self.api_executor.initialize())
-                else:
-                    # If no loop is running, use asyncio.run
-                    asyncio.run(self.api_executor.initialize())
-            except RuntimeError:
-                # Create new loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.api_executor.initialize())
+            self._run_async(self.api_executor.initialize(), timeout=API_INIT_TIMEOUT)
+
+    def _run_api(self, coro):
+        """Run an API executor coroutine once its session is up"""
+        self._ensure_api_executor_initialized()
+        self._api_used = True
+        return self._run_async(coro)
 
     def _wait_after_action(self, action: str):
         """Apply configurable wait after action execution"""
-        # Get wait configuration
-        wait_config = self.config.get('wait_after_actions', {})
-        default_wait = wait_config.get('default', 0.5)
-        action_specific_wait = wait_config.get(action, default_wait)
+        action_specific_wait = self._action_waits.get(action, self._default_wait)
 
         # Apply wait if configured
         if action_specific_wait > 0:
@@ -223,14 +487,10 @@ class StepExecutor:
 
         # Check if URL is a key in config pages
         pages = self.config.get('pages', {})
-        if page_name in pages:
-            url = pages[page_name]
-        elif page_name.replace(' ', '_') in pages:
-            url = pages[page_name.replace(' ', '_')]
-        elif page_name.replace(' ', '-') in pages:
-            url = pages[page_name.replace(' ', '-')]
-        elif url in pages:
-            url = pages[url]
+        page_key = next((key for key in (page_name, page_name.replace(' ', '_'),
+                                         page_name.replace(' ', '-'), url) if key in pages), None)
+        if page_key is not None:
+            url = pages[page_key]
 
         # Check if it's a relative URL
         if not url.startswith(('http://', 'https://')):
@@ -242,11 +502,14 @@ class StepExecutor:
                 url = f"{base_url}/{url}"
 
         logger.info(f"Navigating to: {url}")
-        self.page.goto(url, wait_until='networkidle')
-        self.page.wait_for_load_state('domcontentloaded')
+        self.page.goto(url, wait_until='domcontentloaded')
 
-        # Small wait for dynamic content
-        time.sleep(self.wait_time / 1000)
+        # Wait for the page's own readiness marker when configured, else a small fixed wait
+        ready_selector = self.config.get('ready_selectors', {}).get(page_key) if page_key else None
+        if ready_selector:
+            self.page.wait_for_selector(ready_selector, timeout=self.timeout)
+        else:
+            time.sleep(self.wait_time / 1000)
         return {'url': self.page.url}
 
     def _handle_click(self, params: Dict) -> Any:
@@ -266,227 +529,56 @@ class StepExecutor:
         # This is faster and more reliable than AI detection
 
         # Extract potential text from quotes or use the full description
-        import re
-
-        # First, try to extract text between quotes
-        # Handle both "text" and 'text' patterns
-        search_texts = []
-
-        # Pattern 1: Text within double quotes
-        double_quote_match = re.search(r'"([^"]+)"', element_desc)
-        if double_quote_match:
-            search_texts.append(double_quote_match.group(1))
-
-        # Pattern 2: Text within single quotes
-        single_quote_match = re.search(r"'([^']+)'", element_desc)
-        if single_quote_match:
-            search_texts.append(single_quote_match.group(1))
-
-        # Pattern 3: If no quotes found, try the whole text
-        if not search_texts:
-            # Remove common suffixes
-            clean_text = element_desc.strip()
-            for suffix in [' link', ' button', ' tab', ' menu', ' item']:
+        # Handle both "text" and 'text' patterns, longest quote first
+        quoted = [match.group(1) for match in (DOUBLE_QUOTED_PATTERN.search(element_desc),
+                                               SINGLE_QUOTED_PATTERN.search(element_desc)) if match]
+        quoted.sort(key=len, reverse=True)
+
+        # If no quotes found, try the whole text without common suffixes
+        clean_text = element_desc.strip()
+        if not quoted:
+            for suffix in CLICK_DESCRIPTION_SUFFIXES:
                 if clean_text.lower().endswith(suffix):
                     clean_text = clean_text[:-len(suffix)].strip()
                     break
-            search_texts.append(clean_text)
 
-        # Also add the full original text as fallback
-        if element_desc.strip() not in search_texts:
-            search_texts.append(element_desc.strip())
+        # Ordered and de-duplicated, with the full original text as fallback
+        search_texts = [text for text in dict.fromkeys([*quoted, clean_text, element_desc.strip()]) if text]
 
         logger.info(f"Search texts to try: {search_texts}")
 
-        # Try each potential text
+        # Try the full text of each candidate first
         for search_text in search_texts:
             logger.info(f"Trying to find element with text: '{search_text}'")
+            # Selector unions, most specific group first
+            result = self._click_first_match(
+                (union.format(t=search_text) for union in CLICK_SELECTOR_UNIONS), element_desc)
+            if result:
+                return result
 
-            # Build a comprehensive list of selectors
-            selectors = []
-
-            # Most specific selectors first
-            selectors.extend([
-                # Exact text matches
-                f'a:text-is("{search_text}")',
-                f'button:text-is("{search_text}")',
-                f'[role="button"]:text-is("{search_text}")',
-                f'[role="link"]:text-is("{search_text}")',
-
-                # Exact match for links (highest priority for link elements)
-                f'a:has-text("{search_text}"):has-text("{search_text}")',  # Double check for exact match
-                f'a[href*="{search_text}"]',  # Link with href containing the text
-
-                # Common button patterns
-                f'button:has-text("{search_text}")',
-                f'input[type="button"][value*="{search_text}" i]',
-                f'input[type="submit"][value*="{search_text}" i]',
-                f'button[type="submit"]:has-text("{search_text}")',
-                f'button[type="button"]:has-text("{search_text}")',
-
-                # Links
-                f'a:has-text("{search_text}")',
-                f'a[href]:has-text("{search_text}")',
-                f'a[title*="{search_text}" i]',
-
-                # Links in table cells (important for data grids)
-                f'td a:has-text("{search_text}")',
-                f'th a:has-text("{search_text}")',
-                f'.ant-table-cell a:has-text("{search_text}")',
-                f'[role="gridcell"] a:has-text("{search_text}")',
-                f'[role="cell"] a:has-text("{search_text}")',
-
-                # Elements with click handlers
-                f'[onclick]:has-text("{search_text}")',
-                f'[ng-click]:has-text("{search_text}")',
-                f'[data-click]:has-text("{search_text}")',
-                f'[role="button"]:has-text("{search_text}")',
-                f'[role="link"]:has-text("{search_text}")',
-                f'[role="menuitem"]:has-text("{search_text}")',
-                f'[role="tab"]:has-text("{search_text}")',
-
-                # Table cells (clickable data)
-                f'td:has-text("{search_text}")',
-                f'th:has-text("{search_text}")',
-                f'td a:has-text("{search_text}")',
-                f'td button:has-text("{search_text}")',
-                f'td:has-text("{search_text}") a',  # Link inside td with text
-                f'tbody td:has-text("{search_text}")',  # Body cell with text
-
-                # Common UI frameworks
-                f'.btn:has-text("{search_text}")',  # Bootstrap
-                f'.ant-btn:has-text("{search_text}")',  # Ant Design
-                f'.MuiButton-root:has-text("{search_text}")',  # Material UI
-
-                # Generic clickable classes
-                f'.clickable:has-text("{search_text}")',
-                f'.link:has-text("{search_text}")',
-                f'[class*="click"]:has-text("{search_text}")',
-                f'[class*="button"]:has-text("{search_text}")',
-
-                # Structural elements that might be clickable
-                f'li:has-text("{search_text}")',
-                f'span:has-text("{search_text}")',
-                f'div:has-text("{search_text}")',
-                f'p:has-text("{search_text}")',
-
-                # Generic visible element
-                f'*:has-text("{search_text}"):visible'
-            ])
-
-            # If the text is long (might be truncated in UI), also try partial matches
-            if len(search_text) > 15:
-                # Try different partial lengths
-                partials = [
-                    search_text[:10],  # First 10 chars
-                    search_text[:15],  # First 15 chars
-                    search_text[:20] if len(search_text) > 20 else search_text,  # First 20 chars
-                ]
-
-                for partial in partials:
-                    selectors.extend([
-                        # Prioritize links in table cells for partial matches
-                        f'td a:has-text("{partial}")',
-                        f'.ant-table-cell a:has-text("{partial}")',
-                        f'[role="gridcell"] a:has-text("{partial}")',
-                        f'tbody a:has-text("{partial}")',
-
-                        # Then general links
-                        f'a:has-text("{partial}")',
-
-                        # Then other elements
-                        f'button:has-text("{partial}")',
-                        f'td:has-text("{partial}")',
-                        f'[onclick]:has-text("{partial}")',
-                        f'*:has-text("{partial}"):visible'
-                    ])
-
-            # Try each selector
-            for selector in selectors:
-                try:
-                    elements = self.page.locator(selector).all()
-
-                    # Try each matching element
-                    for element in elements:
-                        if not element.is_visible():
-                            continue
-
-                        # For generic selectors, verify it's actually clickable
-                        if selector.endswith(':visible') or 'div:' in selector or 'span:' in selector:
-                            # Check if element has click-related attributes or is within a clickable parent
-                            is_clickable = element.evaluate("""
-                                (el) => {
-                                    // Check if element itself is clickable
-                                    if (el.onclick || el.href || el.type === 'button' || el.type === 'submit' ||
-                                        el.tagName === 'A' || el.tagName === 'BUTTON' || 
-                                        el.role === 'button' || el.role === 'link' ||
-                                        el.style.cursor === 'pointer') {
-                                        return true;
-                                    }
-
-                                    // Check if any parent (up to 3 levels) is clickable
-                                    let parent = el.parentElement;
-                                    let levels = 0;
-                                    while (parent && levels < 3) {
-                                        if (parent.onclick || parent.href || parent.tagName === 'A' || 
-                                            parent.tagName === 'BUTTON' || parent.role === 'button' || 
-                                            parent.role === 'link') {
-                                            return true;
-                                        }
-                                        parent = parent.parentElement;
-                                        levels++;
-                                    }
-
-                                    return false;
-                                }
-                            """)
-
-                            if not is_clickable and ('div:' in selector or 'span:' in selector):
-                                continue
-
-                        # Ensure element is in viewport
-                        element.scroll_into_view_if_needed()
-                        time.sleep(0.3)
-
-                        # Try to click
-                        try:
-                            element.click()
-                            logger.info(f"Successfully clicked using selector: {selector}")
-
-                            # Wait for any navigation or DOM changes
-                            try:
-                                self.page.wait_for_load_state('networkidle', timeout=3000)
-                            except:
-                                time.sleep(0.5)
-
-                            return {'clicked': element_desc}
-                        except Exception as click_error:
-                            logger.debug(f"Click failed: {click_error}")
-                            # Try force click
-                            try:
-                                element.click(force=True)
-                                logger.info(f"Force clicked using selector: {selector}")
-                                time.sleep(0.5)
-                                return {'clicked': element_desc}
-                            except:
-                                continue
-
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+        # Long texts might be truncated in the UI: only try partial matches once every full text missed
+        for search_text in search_texts:
+            if len(search_text) <= 15:
+                continue
+            logger.info(f"Trying partial matches for text: '{search_text}'")
+            # Different partial lengths: first 10, 15 and (up to) 20 chars
+            partials = dict.fromkeys([search_text[:10], search_text[:15], search_text[:20]])
+            result = self._click_first_match(
+                (union.format(t=partial) for partial in partials for union in PARTIAL_CLICK_SELECTOR_UNIONS),
+                element_desc)
+            if result:
+                return result
 
         # Strategy 2: Use coordinate-based clicking for visible text
         try:
             for search_text in search_texts:
-                text_elements = self.page.locator(f'text="{search_text}"').all()
-                for text_element in text_elements:
-                    if text_element.is_visible():
-                        box = text_element.bounding_box()
-                        if box:
-                            self.page.mouse.click(box['x'] + box['width'] / 2, box['y'] + box['height'] / 2)
-                            logger.info(f"Clicked using coordinates for text: {search_text}")
-                            time.sleep(0.5)
-                            return {'clicked': element_desc}
+                # Visibility and position of every match in one round-trip
+                center = self.page.locator(f'text="{search_text}"').evaluate_all(FIRST_VISIBLE_CENTER_JS)
+                if center:
+                    self.page.mouse.click(center['x'], center['y'])
+                    logger.info(f"Clicked using coordinates for text: {search_text}")
+                    time.sleep(0.5)
+                    return {'clicked': element_desc}
         except Exception as e:
             logger.debug(f"Coordinate click failed: {e}")
 
@@ -494,49 +586,103 @@ class StepExecutor:
         logger.info("Falling back to AI detection")
 
         # Debug: Log all links found on the page
-        try:
-            all_links = self.page.locator('a:visible').all()
-            logger.debug(f"Found {len(all_links)} visible links on page")
-            for i, link in enumerate(all_links[:10]):  # Log first 10 links
-                link_text = link.text_content()
-                link_href = link.get_attribute('href')
-                logger.debug(f"Link {i}: text='{link_text}', href='{link_href}'")
-
-            # Also check table cells in first column
-            first_col_cells = self.page.locator('td:first-child:visible').all()
-            logger.debug(f"Found {len(first_col_cells)} first column cells")
-            for i, cell in enumerate(first_col_cells[:5]):
-                cell_text = cell.text_content()
-                logger.debug(f"First column cell {i}: '{cell_text}'")
-        except Exception as e:
-            logger.debug(f"Debug logging failed: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                links = self.page.locator('a:visible').evaluate_all(ELEMENT_SUMMARY_JS, 10)
+                logger.debug(f"Found {links['count']} visible links on page")
+                for i, link in enumerate(links['items']):  # Log first 10 links
+                    logger.debug(f"Link {i}: text='{link['text']}', href='{link['href']}'")
+
+                # Also check table cells in first column
+                cells = self.page.locator('td:first-child:visible').evaluate_all(ELEMENT_SUMMARY_JS, 5)
+                logger.debug(f"Found {cells['count']} first column cells")
+                for i, cell in enumerate(cells['items']):
+                    logger.debug(f"First column cell {i}: '{cell['text']}'")
+            except Exception as e:
+                logger.debug(f"Debug logging failed: {e}")
 
-        screenshot = self.page.screenshot()
-        element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+        element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
         if element_info:
             if element_info.get('selector'):
                 element = self.page.locator(element_info['selector'])
-                element.wait_for(state='visible', timeout=self.timeout)
-                element.scroll_into_view_if_needed()
-                element.click()
+                element.click(timeout=self.timeout)
             else:
                 self.ai_finder.click_at_position(self.page, element_info['position'])
 
             try:
-                # First wait for any immediate navigation
+                # Wait for any immediate navigation
                 self.page.wait_for_load_state('domcontentloaded', timeout=5000)
-                # Then wait for network to settle
-                self.page.wait_for_load_state('networkidle', timeout=10000)
-                # Additional wait for dynamic content
-                time.sleep(1)
             except:
-                time.sleep(1)
+                pass
+            # Additional wait for dynamic content
+            time.sleep(1)
 
             return {'clicked': element_desc}
 
         raise Exception(f"Element not found: {element_desc}")
 
+    def _click_first_match(self, selectors, element_desc: str) -> Optional[Dict]:
+        """Click the best match of the first selector that yields a clickable element"""
+        # Try each selector union: one query for the whole group
+        for selector in selectors:
+            try:
+                locator = self.page.locator(selector)
+                # Tag, visibility and clickability of every match in one round-trip
+                candidates = locator.evaluate_all(CLICK_CANDIDATES_JS)
+                # Generic div/span matches must actually be clickable
+                needs_clickable = 'div:' in selector or 'span:' in selector
+
+                # Try the matching elements, most likely click target first
+                for index in self._rank_click_candidates(candidates, needs_clickable):
+                    element = locator.nth(index)
+
+                    # Try to click; Playwright scrolls it into view and waits until it is stable
+                    try:
+                        element.click()
+                        logger.info(f"Successfully clicked using selector: {selector}")
+
+                        # Wait for any navigation the click started
+                        try:
+                            self.page.wait_for_load_state('domcontentloaded', timeout=3000)
+                        except:
+                            time.sleep(0.5)
+
+                        return {'clicked': element_desc}
+                    except Exception as click_error:
+                        logger.debug(f"Click failed: {click_error}")
+                        # Try force click
+                        try:
+                            element.click(force=True)
+                            logger.info(f"Force clicked using selector: {selector}")
+                            time.sleep(0.5)
+                            return {'clicked': element_desc}
+                        except:
+                            continue
+
+            except Exception as e:
+                logger.debug(f"Selector {selector} failed: {e}")
+                continue
+
+        return None
+
+    @staticmethod
+    def _rank_click_candidates(candidates: List[Dict], needs_clickable: bool) -> List[int]:
+        """Indices of visible click candidates ordered by tag priority, then DOM order"""
+        ranked = []
+        for index, candidate in enumerate(candidates):
+            if not candidate['visible']:
+                continue
+            tag = candidate['tag']
+            if needs_clickable and tag in UNCLICKABLE_TAGS and not candidate['clickable']:
+                continue
+            priority = CLICK_TAG_PRIORITY.get(tag, DEFAULT_CLICK_PRIORITY)
+            if candidate['role'] == 'button' and priority > ROLE_BUTTON_PRIORITY:
+                priority = ROLE_BUTTON_PRIORITY
+            ranked.append((priority, index))
+        ranked.sort()
+        return [index for _, index in ranked]
+
     def _handle_input(self, params: Dict) -> Any:
         """Handle input/type actions"""
         element_desc = params.get('element', '')
@@ -554,9 +700,7 @@ class StepExecutor:
             try:
                 if force_ai:
                     logger.info(f"Force AI detection enabled for field: {element_desc}")
-                    # Take screenshot for AI detection
-                    screenshot = self.page.screenshot()
-                    element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+                    element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
                     if element_info:
                         if element_info.get('selector'):
@@ -594,66 +738,16 @@ class StepExecutor:
 
                 # First, let's try to find the element by looking for labels
                 # This helps with rich text editors that are associated with labels
-                label_selectors = [
-                    # Direct sibling selectors (most specific)
-                    f'label:has-text("{element_desc}") + div [contenteditable="true"]',
-                    f'label:has-text("{element_desc}") + div .ql-editor',
-
-                    # Next sibling with some elements in between
-                    f'label:has-text("{element_desc}") ~ div [contenteditable="true"]:first',
-                    f'label:has-text("{element_desc}") ~ div .ql-editor:first',
-
-                    # Parent-based but more specific - look for the closest parent with the label
-                    f'div:has(> label:has-text("{element_desc}")) > div [contenteditable="true"]',
-                    f'div:has(> label:has-text("{element_desc}")) > div .ql-editor',
-
-                    # XPath-based for more precise traversal
-                    f'label:has-text("{element_desc}") >> xpath=following-sibling::div[1] >> [contenteditable="true"]',
-                    f'label:has-text("{element_desc}") >> xpath=following-sibling::div[1] >> .ql-editor',
-
-                    # For Ant Design form items specifically
-                    f'.ant-form-item:has(label:has-text("{element_desc}")) > .ant-form-item-control [contenteditable="true"]',
-                    f'.ant-form-item:has(label:has-text("{element_desc}")) > .ant-form-item-control .ql-editor',
-
-                    # More flexible patterns
-                    f'.ant-form-item:has(label:text-is("{element_desc}")) [contenteditable="true"]',
-                    f'.ant-form-item:has(label:text-is("{element_desc}")) .ql-editor',
-
-                    # Dynamic field patterns - fields that appear after radio/checkbox selection
-                    f'*[style*="display: block"] label:has-text("{element_desc}") + input',
-                    f'*[style*="display: block"] label:has-text("{element_desc}") ~ input',
-                    f'*:not([style*="display: none"]) label:has-text("{element_desc}") + input',
-                    f'*:not([hidden]) label:has-text("{element_desc}") + input',
-
-                    # Fields in conditionally shown containers
-                    f'.show label:has-text("{element_desc}") + input',
-                    f'.active label:has-text("{element_desc}") + input',
-                    f'[class*="visible"] label:has-text("{element_desc}") + input',
-                    f'[class*="expanded"] label:has-text("{element_desc}") + input',
-
-                    # For number inputs specifically (quota limits are often numbers)
-                    f'label:has-text("{element_desc}") + input[type="number"]',
-                    f'label:has-text("{element_desc}") ~ input[type="number"]',
-                    f'input[type="number"][aria-label*="{element_desc}" i]',
-
-                    # Nested in form groups that may be dynamically shown
-                    f'.form-group:not([style*="display: none"]) label:has-text("{element_desc}") + input',
-                    f'[class*="form-field"]:not([style*="display: none"]) label:has-text("{element_desc}") + input',
-                ]
-
-                # Try label-based selectors first for rich text editors
-                rich_text_found = False
-                for selector in label_selectors:
+                for union in LABEL_INPUT_SELECTOR_UNIONS:
                     try:
-                        elements = self.page.locator(selector).all()
-                        logger.debug(f"Trying selector '{selector}' - found {len(elements)} elements")
-                        for element in elements:
-                            if element.is_visible():
-                                logger.info(f"Found rich text editor using selector: {selector}")
-                                # Handle rich text editor input
-                                return self._input_to_rich_text_editor(element, value, element_desc)
+                        # One query for the whole group; the first visible match wins
+                        element = self.page.locator(union.format(d=element_desc)).first
+                        if element.count():
+                            logger.info(f"Found rich text editor using selector: {union}")
+                            # Handle rich text editor input
+                            return self._input_to_rich_text_editor(element, value, element_desc)
                     except Exception as e:
-                        logger.debug(f"Label selector {selector} failed: {e}")
+                        logger.debug(f"Label selector {union} failed: {e}")
                         continue
 
                 # Alternative approach: Find the label first, then look for the nearest editor
@@ -735,9 +829,6 @@ class StepExecutor:
                     logger.debug(f"Alternative label-based approach failed: {e}")
 
                 # If no rich text editor found via label selectors, use AI detection
-                # Take screenshot for AI detection
-                screenshot = self.page.screenshot()
-
                 # Try additional generic selectors for various input types
                 generic_input_selectors = [
                     # Try to find textarea by partial text match in nearby elements
@@ -766,7 +857,7 @@ class StepExecutor:
                         continue
 
                 # Find element using AI
-                element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+                element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
                 if element_info:
                     if element_info.get('selector'):
@@ -1055,7 +1146,7 @@ class StepExecutor:
                 continue
 
         # Use AI finder as fallback
-        element_info = self.ai_finder.find_element(self.page, description, self.page.screenshot())
+        element_info = self.ai_finder.find_element(self.page, description, self._ai_screenshot)
         if element_info and element_info.get('selector'):
             try:
                 element = self.page.locator(element_info['selector']).first
@@ -1124,9 +1215,6 @@ class StepExecutor:
         # Use the element description to find the trigger
         logger.info(f"No open dropdown found, looking for trigger element: {element_desc}")
 
-        # Take screenshot for AI detection
-        screenshot = self.page.screenshot()
-
         # Find trigger element using AI or pattern matching
         if element_desc and element_desc.lower() not in ['dropdown', 'menu', 'select']:
             # Use the element description to find the trigger
@@ -1190,11 +1278,8 @@ class StepExecutor:
         # Ensure we're in the right frame
         context = self._get_current_context()
 
-        # Take screenshot for AI detection
-        screenshot = self.page.screenshot()
-
         # Find element using AI
-        element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+        element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
         if element_info:
             if element_info.get('selector'):
@@ -1718,8 +1803,7 @@ class StepExecutor:
 
         # Last resort: Use AI detection
         logger.info("Falling back to AI detection for checkbox")
-        screenshot = self.page.screenshot()
-        element_info = self.ai_finder.find_element(self.page, f"checkbox {element_desc}", screenshot)
+        element_info = self.ai_finder.find_element(self.page, f"checkbox {element_desc}", self._ai_screenshot)
 
         if element_info:
             if element_info.get('selector'):
@@ -1862,8 +1946,7 @@ class StepExecutor:
 
         # If standard selectors fail, try AI detection
         logger.info("Falling back to AI detection for radio button")
-        screenshot = self.page.screenshot()
-        element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+        element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
         if element_info:
             if element_info.get('selector'):
@@ -1912,11 +1995,8 @@ class StepExecutor:
         """Verify element is visible"""
         element_desc = params.get('element', '')
 
-        # Take screenshot for AI detection
-        screenshot = self.page.screenshot()
-
         # Find element using AI
-        element_info = self.ai_finder.find_element(self.page, element_desc, screenshot)
+        element_info = self.ai_finder.find_element(self.page, element_desc, self._ai_screenshot)
 
         if element_info:
             return {'verified': element_desc, 'visible': True}
@@ -1949,8 +2029,7 @@ class StepExecutor:
 
         elif element:
             # Wait for element
-            screenshot = self.page.screenshot()
-            element_info = self.ai_finder.find_element(self.page, element, screenshot)
+            element_info = self.ai_finder.find_element(self.page, element, self._ai_screenshot)
 
             if element_info and element_info.get('selector'):
                 self.page.wait_for_selector(element_info['selector'], timeout=self.timeout)
@@ -1959,8 +2038,7 @@ class StepExecutor:
                 # Retry with polling
                 start_time = time.time()
                 while time.time() - start_time < self.timeout / 1000:
-                    screenshot = self.page.screenshot()
-                    element_info = self.ai_finder.find_element(self.page, element, screenshot)
+                    element_info = self.ai_finder.find_element(self.page, element, self._ai_screenshot)
                     if element_info:
                         return {'waited_for': element}
                     time.sleep(0.5)
@@ -1975,6 +2053,10 @@ class StepExecutor:
         self.page.screenshot(path=path)
         return {'screenshot': path}
 
+    def _ai_screenshot(self) -> bytes:
+        """Screenshot for AI detection, taken only when the finder actually runs its model"""
+        return screenshot_bytes(self.page)
+
     def _take_screenshot(self) -> str:
         """Take screenshot for error reporting"""
         try:
@@ -2279,8 +2361,6 @@ class StepExecutor:
         field = params.get('field', 'search')
 
         # Find search field
-        screenshot = self.page.screenshot()
-
         # Try to find search input with generic strategies
         search_selectors = [
             # ID-based (most specific)
@@ -2330,7 +2410,7 @@ class StepExecutor:
 
         if not element:
             # Use AI finder as fallback
-            element_info = self.ai_finder.find_element(self.page, field + " field", screenshot)
+            element_info = self.ai_finder.find_element(self.page, field + " field", self._ai_screenshot)
             if element_info and element_info.get('selector'):
                 element = self.page.locator(element_info['selector'])
                 logger.info(f"Found search input using AI finder")
@@ -2715,7 +2795,7 @@ class StepExecutor:
         logger.info(f"Calling API: {api_name}")
 
         # Run async API call
-        response = asyncio.run(self.api_executor.execute_api(
+        response = self._run_api(self.api_executor.execute_api(
             api_name,
             test_name=self.current_test_name
         ))
@@ -2750,7 +2830,7 @@ class StepExecutor:
         logger.info(f"Calling API: {api_name} with params: {api_params}")
 
         # Run async API call
-        response = asyncio.run(self.api_executor.execute_api(
+        response = self._run_api(self.api_executor.execute_api(
             api_name,
             test_name=self.current_test_name,
             **api_params
@@ -2778,7 +2858,7 @@ class StepExecutor:
         self.api_executor.store_value('password', password)
 
         # Call login API
-        response = asyncio.run(self.api_executor.execute_api(
+        response = self._run_api(self.api_executor.execute_api(
             'login',
             test_name=f"Authentication: {username}"
         ))
@@ -2896,7 +2976,7 @@ class StepExecutor:
             raise Exception("Response body is not JSON")
 
         # Use JSONPath to get actual value
-        expression = parse(field_path)
+        expression = jsonpath_compile(field_path)
         matches = expression.find(self.last_api_response['body'])
 
         if not matches:
@@ -2935,7 +3015,7 @@ class StepExecutor:
                     continue
 
                 # Use JSONPath to get actual value
-                expression = parse(field_path)
+                expression = jsonpath_compile(field_path)
                 matches = expression.find(self.last_api_response['body'])
 
                 if not matches:
@@ -2960,7 +3040,7 @@ class StepExecutor:
             raise Exception("Response body is not JSON")
 
         # Use JSONPath to get value
-        expression = parse(field_path)
+        expression = jsonpath_compile(field_path)
         matches = expression.find(self.last_api_response['body'])
 
         if not matches:
@@ -3060,7 +3140,7 @@ class StepExecutor:
         logger.info(f"Uploading file {file_path} to API: {api_name}")
 
         # Run async file upload
-        response = asyncio.run(self.api_executor.execute_file_upload(
+        response = self._run_api(self.api_executor.execute_file_upload(
             api_name,
             file_path,
             test_name=self.current_test_name,
@@ -3439,8 +3519,7 @@ class StepExecutor:
 
         if not element:
             # Use AI finder as fallback
-            screenshot = self.page.screenshot()
-            element_info = self.ai_finder.find_element(self.page, element_desc + " date time picker", screenshot)
+            element_info = self.ai_finder.find_element(self.page, element_desc + " date time picker", self._ai_screenshot)
             if element_info and element_info.get('selector'):
                 element = self.page.locator(element_info['selector'])
             else:
@@ -3641,8 +3720,7 @@ class StepExecutor:
 
         if not element:
             # Use AI finder as fallback
-            screenshot = self.page.screenshot()
-            element_info = self.ai_finder.find_element(self.page, element_desc + " date picker", screenshot)
+            element_info = self.ai_finder.find_element(self.page, element_desc + " date picker", self._ai_screenshot)
             if element_info and element_info.get('selector'):
                 element = self.page.locator(element_info['selector'])
             else:
@@ -3824,8 +3902,7 @@ class StepExecutor:
 
         if not element:
             # Try AI finder as fallback
-            screenshot = self.page.screenshot()
-            element_info = self.ai_finder.find_element(self.page, element_desc + " date range picker", screenshot)
+            element_info = self.ai_finder.find_element(self.page, element_desc + " date range picker", self._ai_screenshot)
             if element_info and element_info.get('selector'):
                 element = self.page.locator(element_info['selector'])
             else:
@@ -3903,7 +3980,22 @@ class StepExecutor:
 
         raise Exception(f"Could not select date range in field '{element_desc}'")
 
+    def close(self):
+        """Close the API session, writing the API report only if an API step ran"""
+        if not self.api_executor:
+            return
+        try:
+            if self._api_warmup is not None:
+                warmup, self._api_warmup = self._api_warmup, None
+                warmup.result(API_INIT_TIMEOUT)
+            if self._api_used:
+                self._run_async(self.api_executor.cleanup())
+            else:
+                self._run_async(self.api_executor.close())
+        except Exception as e:
+            logger.warning(f"Failed to close API executor: {e}")
+
     def cleanup(self):
         """Cleanup resources"""
         if self.api_executor:
-            asyncio.run(self.api_executor.cleanup())
\ No newline at end of file
+            self._run_async(self.api_executor.cleanup())
\ No newline at end of file
@@ -11,6 +11,22 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+class InlineExecutor:
+    """Executor stand-in that runs submitted work immediately in the calling thread"""
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            # KeyboardInterrupt/SystemExit propagate so the remaining scenarios never start
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
 class TestExecutor:
     """Orchestrates test execution"""
 
@@ -23,6 +39,8 @@ class TestExecutor:
         self.ai_model = ai_model
         self.parallel = parallel
         self.results = []
+        self.failed_count = 0
+        self._pool = None
 
         # Initialize cache manager
         self.cache_manager = CacheManager() if use_cache else None
@@ -41,27 +59,44 @@ class TestExecutor:
                     'scenario': scenario
                 })
 
-        # Execute scenarios
-        if self.parallel > 1:
-            # Parallel execution
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel) as executor:
-                futures = []
-                for item in all_scenarios:
-                    future = executor.submit(self._execute_scenario,
-                                             item['feature'], item['scenario'])
-                    futures.append(future)
-
-                for future in concurrent.futures.as_completed(futures):
-                    result = future.result()
-                    self.results.append(result)
-        else:
-            # Sequential execution
-            for item in all_scenarios:
-                result = self._execute_scenario(item['feature'], item['scenario'])
-                self.results.append(result)
+        # Execute scenarios - the same path serves sequential and parallel runs
+        pool = self._get_pool()
+        futures = [pool.submit(self._execute_scenario, item['feature'], item['scenario'])
+                   for item in all_scenarios]
+
+        # Collect in submission order so reports stay deterministic,
+        # counting failures on the way so callers don't re-walk the results
+        for future in futures:
+            result = future.result()
+            if result['status'] == 'failed':
+                self.failed_count += 1
+            self.results.append(result)
 
         return self.results
 
+    def _get_pool(self):
+        """Get the worker pool, creating it once per executor"""
+        if self._pool is None:
+            if self.parallel > 1:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.parallel, thread_name_prefix='wtr'
+                )
+            else:
+                self._pool = InlineExecutor()
+        return self._pool
+
+    def close(self):
+        """Shut down the worker pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _execute_scenario(self, feature: Feature, scenario: Scenario) -> Dict:
         """Execute a single scenario"""
         logger.info(f"Executing scenario: {scenario.name}")
@@ -124,10 +159,14 @@ class TestExecutor:
             # Take final screenshot
             if scenario_result['status'] == 'failed':
                 screenshot = self.browser_manager.take_screenshot(
-                    f"{feature.name}_{scenario.name}_failed".replace(' ', '_')
+                    f"{feature.name}_{scenario.name}_failed".replace(' ', '_'),
+                    full_page=True
                 )
                 scenario_result['screenshot'] = screenshot
 
+            # Release the scenario's API session before the browser goes away
+            step_executor.close()
+
             # Stop browser
             self.browser_manager.stop()
 
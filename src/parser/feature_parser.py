@@ -3,11 +3,15 @@ Feature parser with NLP capabilities
 Parses Gherkin feature files and maps to executable steps
 """
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
 from enum import Enum
+from src.utils.models import slotted_dataclass
+
+QUOTED_STRING_PATTERN = re.compile(r'["\']([^"\']+)["\']')
 
 class StepType(Enum):
     GIVEN = "given"
@@ -16,7 +20,7 @@ class StepType(Enum):
     AND = "and"
     BUT = "but"
 
-@dataclass
+@slotted_dataclass()
 class Step:
     type: StepType
     text: str
@@ -25,7 +29,7 @@ class Step:
     line_number: int
     data_table: Optional[List[List[str]]] = None
 
-@dataclass
+@slotted_dataclass()
 class Scenario:
     name: str
     description: str
@@ -34,7 +38,7 @@ class Scenario:
     examples: Optional[Dict] = None
     line_number: int = 0
 
-@dataclass
+@slotted_dataclass()
 class Feature:
     name: str
     description: str
@@ -46,13 +50,19 @@ class Feature:
 class FeatureParser:
     """Parse Gherkin feature files with NLP understanding"""
 
-    def __init__(self, features_dir: str):
-        self.features_dir = Path(features_dir)
+    def __init__(self, features_dir: Union[str, Path]):
+        self.features_dir = features_dir if isinstance(features_dir, Path) else Path(features_dir)
+        # Shared, already-compiled table - built once per process, not per parser
         self.action_patterns = self._initialize_action_patterns()
 
-    def _initialize_action_patterns(self) -> Dict:
+        # Identical step texts recur across scenarios and Examples; match each once
+        self._step_text_cache = lru_cache(maxsize=4096)(self._match_step_text)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _initialize_action_patterns() -> Dict:
         """Initialize NLP patterns for step mapping"""
-        return {
+        action_patterns = {
             # Navigation patterns
             'navigate': {
                 'patterns': [
@@ -432,35 +442,87 @@ class FeatureParser:
             }
         }
 
-    def parse_features(self, tags: List[str] = None) -> List[Feature]:
+        # Compile every pattern once so step parsing never hits the re module cache
+        for pattern_info in action_patterns.values():
+            pattern_info['compiled'] = tuple(re.compile(pattern, re.IGNORECASE)
+                                             for pattern in pattern_info['patterns'])
+
+        return action_patterns
+
+    def parse_features(self, tags: Iterable[str] = None) -> List[Feature]:
         """Parse all feature files in directory"""
-        features = []
+        return list(self.iter_features(tags))
+
+    def iter_features(self, tags: Iterable[str] = None) -> Iterator[Feature]:
+        """Lazily parse feature files, skipping files that can't match the tags"""
+        tags = frozenset(tags) if tags else None
 
-        # Find all .feature files
-        feature_files = list(self.features_dir.glob("**/*.feature"))
+        for feature_file in self._iter_feature_paths(self.features_dir):
+            try:
+                with open(feature_file, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            except OSError as e:
+                print(f"Error parsing feature file {feature_file}: {e}")
+                continue
 
-        for feature_file in feature_files:
-            feature = self._parse_feature_file(feature_file)
+            # Cheap pre-filter: no tag line mentions a wanted tag, so no scenario can match
+            if tags and not self._has_any_tag(lines, tags):
+                continue
+
+            feature = self._parse_feature_file(Path(feature_file), lines)
             if feature:
                 # Filter by tags if provided
                 if tags:
-                    filtered_scenarios = []
-                    for scenario in feature.scenarios:
-                        if any(tag in scenario.tags for tag in tags):
-                            filtered_scenarios.append(scenario)
+                    filtered_scenarios = [scenario for scenario in feature.scenarios
+                                          if not tags.isdisjoint(scenario.tags)]
                     if filtered_scenarios:
                         feature.scenarios = filtered_scenarios
-                        features.append(feature)
+                        yield feature
                 else:
-                    features.append(feature)
-
-        return features
-
-    def _parse_feature_file(self, file_path: Path) -> Optional[Feature]:
+                    yield feature
+
+    def _iter_feature_paths(self, root, visited: Optional[set] = None) -> Iterator[str]:
+        """
+        Walk the features tree with os.scandir, yielding .feature file paths
+
+        Directory symlinks are followed; (st_dev, st_ino) of every directory
+        entered is recorded so a symlink cycle is walked only once. Hidden
+        entries (names starting with '.') are skipped.
+        """
+        if visited is None:
+            visited = set()
+        try:
+            stat = os.stat(root)
+            key = (stat.st_dev, stat.st_ino)
+            if key in visited:
+                return
+            visited.add(key)
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        yield from self._iter_feature_paths(entry.path, visited)
+                    elif entry.name.endswith('.feature'):
+                        yield entry.path
+        except OSError:
+            return
+
+    @staticmethod
+    def _has_any_tag(lines: List[str], tags: FrozenSet[str]) -> bool:
+        """Check whether any tag line in the file carries one of the given tags"""
+        for line in lines:
+            line = line.strip()
+            if line.startswith('@') and not tags.isdisjoint(line.split()):
+                return True
+        return False
+
+    def _parse_feature_file(self, file_path: Path, lines: Optional[List[str]] = None) -> Optional[Feature]:
         """Parse a single feature file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            if lines is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
 
             feature = None
             current_scenario = None
@@ -583,7 +645,13 @@ class FeatureParser:
             return None
 
     def _parse_step_text(self, step_text: str) -> Tuple[str, Dict]:
-        """Parse step text using NLP patterns"""
+        """Parse step text using NLP patterns (memoized by step text)"""
+        action, params = self._step_text_cache(step_text)
+        # Hand out a copy so callers can't mutate the cached entry
+        return action, dict(params)
+
+    def _match_step_text(self, step_text: str) -> Tuple[str, Dict]:
+        """Match step text against the action patterns"""
         # step_text = step_text.strip()
         original_step_text = step_text.strip()
 
@@ -612,8 +680,8 @@ class FeatureParser:
 
         for action_type in pattern_order:
             pattern_info = self.action_patterns[action_type]
-            for pattern in pattern_info['patterns']:
-                match = re.match(pattern, step_text, re.IGNORECASE)
+            for pattern in pattern_info['compiled']:
+                match = pattern.match(step_text)
                 if match:
                     params = {}
                     groups = match.groups()
@@ -649,7 +717,7 @@ class FeatureParser:
     def _fallback_parse(self, step_text: str) -> Tuple[str, Dict]:
         """Fallback parsing when no pattern matches"""
         # Look for quoted strings
-        quoted_strings = re.findall(r'["\']([^"\']+)["\']', step_text)
+        quoted_strings = QUOTED_STRING_PATTERN.findall(step_text)
 
         # Determine action based on keywords
         step_lower = step_text.lower()
@@ -1,7 +1,10 @@
 """Helper utilities"""
 import re
+from functools import lru_cache
 from typing import Dict, Any, List
 
+from jsonpath_ng import parse as jsonpath_parse
+
 
 def sanitize_filename(name: str) -> str:
     """Sanitize string for use as filename"""
@@ -22,6 +25,12 @@ def deep_get(dictionary: Dict, keys: str, default: Any = None) -> Any:
     return value
 
 
+@lru_cache(maxsize=1024)
+def jsonpath_compile(expression: str):
+    """Compile a JSONPath expression once; step and API config paths repeat across runs"""
+    return jsonpath_parse(expression)
+
+
 def interpolate_string(template: str, data: Dict) -> str:
     """Interpolate variables in string template"""
     for key, value in data.items():
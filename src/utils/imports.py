@@ -0,0 +1,14 @@
+"""Cached dynamic import helpers"""
+import sys
+from functools import lru_cache
+from importlib import import_module
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def cached_import(module_path: str, item_name: str) -> Any:
+    """Import a module attribute once and reuse it on subsequent lookups"""
+    modules = sys.modules
+    if module_path not in modules or getattr(modules[module_path], '__spec__', None) is None:
+        import_module(module_path)
+    return getattr(modules[module_path], item_name)
@@ -0,0 +1,10 @@
+"""Dataclass helpers"""
+import sys
+from dataclasses import dataclass
+
+
+def slotted_dataclass(**kwargs):
+    """dataclass decorator that also drops the per-instance __dict__ (slots need Python 3.10+)"""
+    if sys.version_info >= (3, 10):
+        kwargs['slots'] = True
+    return dataclass(**kwargs)
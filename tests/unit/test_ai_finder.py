@@ -25,4 +25,13 @@ def test_pattern_matching():
 
     assert result is not None
     assert result['type'] == 'button'
-    assert 'Submit' in result['selector']
\ No newline at end of file
+    assert 'Submit' in result['selector']
+
+def test_element_type_classifier_keeps_type_precedence():
+    from src.core.ai_element_finder import ELEMENT_TYPE_CLASSIFIER
+
+    # 'enter' (input) appears before 'button', but button has precedence
+    match = ELEMENT_TYPE_CLASSIFIER.match('enter the search button')
+    assert match.lastgroup == 'button'
+    assert ELEMENT_TYPE_CLASSIFIER.match('username field').lastgroup == 'input'
+    assert ELEMENT_TYPE_CLASSIFIER.match('login') is None
@@ -0,0 +1,54 @@
+"""Unit tests for config manager"""
+from src.core.config_manager import ConfigManager
+
+
+def _write_configs(tmp_path, main: str, env: str):
+    (tmp_path / 'environments').mkdir()
+    (tmp_path / 'config.yaml').write_text(main)
+    (tmp_path / 'environments' / 'test.yaml').write_text(env)
+    return ConfigManager(str(tmp_path / 'config.yaml'), 'test')
+
+
+def test_env_var_inside_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv('WT_TEST_HOST', 'example.com')
+    manager = _write_configs(tmp_path,
+                             'api:\n  port: 80\n  headers:\n    host: localhost\n    accept: json\n',
+                             'overrides:\n  api:\n    headers:\n      host: "${WT_TEST_HOST}"\n')
+    config = manager.load_config()
+
+    assert config['api']['headers']['host'] == 'example.com'
+    # Overrides merge one level deep: sections merge, their values are replaced
+    assert config['api']['port'] == 80
+    assert 'accept' not in config['api']['headers']
+    assert 'overrides' not in config
+
+
+def test_env_var_leaf_replaced_by_merge(tmp_path, monkeypatch):
+    monkeypatch.setenv('WT_TEST_URL', 'from-env')
+    manager = _write_configs(tmp_path,
+                             'base_url: "${WT_TEST_URL}"\n'
+                             'hosts: ["${WT_TEST_URL}", "${WT_TEST_URL}"]\n'
+                             'auth:\n  token: "${WT_TEST_URL}"\n',
+                             'base_url:\n  primary: "http://literal"\n'
+                             'hosts: ["only"]\n'
+                             'auth: plain\n')
+    config = manager.load_config()
+
+    # The env file's values win; the main file's ${VAR} paths no longer lead to a string
+    assert config['base_url'] == {'primary': 'http://literal'}
+    assert config['hosts'] == ('only',)
+    assert config['auth'] == 'plain'
+
+
+def test_env_var_inside_list(tmp_path, monkeypatch):
+    monkeypatch.setenv('WT_TEST_USER', 'alice')
+    monkeypatch.delenv('WT_TEST_UNSET', raising=False)
+    manager = _write_configs(tmp_path,
+                             'users:\n  - name: "${WT_TEST_USER}"\n  - name: bob\n',
+                             'tags: ["smoke", "user-${WT_TEST_USER}", "${WT_TEST_UNSET}"]\n')
+    config = manager.load_config()
+
+    assert config['users'][0]['name'] == 'alice'
+    assert config['users'][1]['name'] == 'bob'
+    # Unset variables are left as-is
+    assert config['tags'] == ('smoke', 'user-alice', '${WT_TEST_UNSET}')
@@ -17,4 +17,12 @@ def test_parse_input_step():
 
     assert action == 'input'
     assert params['value'] == 'john@example.com'
-    assert params['element'] == 'email'
\ No newline at end of file
+    assert params['element'] == 'email'
+
+def test_parse_step_text_returns_independent_params():
+    parser = FeatureParser("features")
+    _, first = parser._parse_step_text('I click the "Login" button')
+    first['element'] = 'changed'
+    _, second = parser._parse_step_text('I click the "Login" button')
+
+    assert second['element'] == 'Login'